@@ -1,7 +1,7 @@
 """Main entry point for ear training application."""
 
 import time
-from ear_training.modules import IntervalTrainer, ChordTrainer, RhythmTrainer, Interval
+from ear_training.modules import IntervalTrainer, ChordTrainer, RhythmTrainer, INTERVAL_NAMES, INTERVAL_BY_NAME
 from ear_training.ui.audio_player import AudioPlayer
 
 
@@ -11,9 +11,11 @@ def interval_training():
     player = AudioPlayer(sample_rate=44100, duration=0.5)
     score = 0
     total = 0
+    interval_names = ", ".join(INTERVAL_NAMES)
+    invalid_hint = "Invalid interval. Try again with one of: " + interval_names
     
     print("\nInterval Training Mode")
-    print("Available intervals: " + ", ".join([i.name for i in Interval]))
+    print("Available intervals: " + interval_names)
     print("Type 'exit' to quit, 'replay' to hear the interval again\n")
     
     while True:
@@ -41,21 +43,22 @@ def interval_training():
                 continue
             
             # Try to match user input to interval
-            try:
-                user_interval = Interval[guess]
-                is_correct = trainer.submit_answer(user_interval)
-                total += 1
-                
-                if is_correct:
-                    print(f"✓ Correct! It was {interval.name}")
-                    score += 1
-                else:
-                    print(f"✗ Wrong. The correct answer was {interval.name}, you said {user_interval.name}")
-                
-                print(f"Score: {score}/{total}\n")
-                break
-            except KeyError:
-                print(f"Invalid interval. Try again with one of: {', '.join([i.name for i in Interval])}")
+            user_interval = INTERVAL_BY_NAME.get(guess)
+            if user_interval is None:
+                print(invalid_hint)
+                continue
+            
+            is_correct = trainer.submit_answer(user_interval)
+            total += 1
+            
+            if is_correct:
+                print(f"✓ Correct! It was {interval.name}")
+                score += 1
+            else:
+                print(f"✗ Wrong. The correct answer was {interval.name}, you said {user_interval.name}")
+            
+            print(f"Score: {score}/{total}\n")
+            break
 
 
 def main():
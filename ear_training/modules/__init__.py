@@ -1,10 +1,10 @@
 """Training modules for ear training application."""
 
-from .intervals import IntervalTrainer, Interval
+from .intervals import IntervalTrainer, Interval, INTERVAL_NAMES, INTERVAL_BY_NAME
 from .chords import ChordTrainer, ChordType
 from .rhythm import RhythmTrainer
 from .notes import NoteTrainer, Note
-from .progressions import ProgressionTrainer, ChordNumber
+from .progressions import ProgressionTrainer, ChordNumber, CHORD_NUMBER_BY_NAME
 
-__all__ = ["IntervalTrainer", "ChordTrainer", "RhythmTrainer", "NoteTrainer", "ProgressionTrainer", "Interval", "ChordType", "Note", "ChordNumber"]
+__all__ = ["IntervalTrainer", "ChordTrainer", "RhythmTrainer", "NoteTrainer", "ProgressionTrainer", "Interval", "ChordType", "Note", "ChordNumber", "INTERVAL_NAMES", "INTERVAL_BY_NAME", "CHORD_NUMBER_BY_NAME"]
 
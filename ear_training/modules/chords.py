@@ -3,6 +3,7 @@
 from typing import List, Tuple
 from enum import Enum
 import random
+import numpy as np
 
 
 class ChordType(Enum):
@@ -17,9 +18,18 @@ class ChordType(Enum):
     MINOR_MAJOR_SEVENTH = [0, 3, 7, 11]
 
 
+# Frequency ratios of each chord's notes relative to its root
+_CHORD_RATIOS: dict[ChordType, np.ndarray] = {
+    chord_type: 2.0 ** (np.asarray(chord_type.value, dtype=np.float64) / 12)
+    for chord_type in ChordType
+}
+
+
 class ChordTrainer:
     """Trains users on chord recognition."""
     
+    __slots__ = ("base_freq", "chord_types", "current_chord", "user_answer")
+    
     def __init__(self, base_freq: float = 440.0):
         """Initialize chord trainer.
         
@@ -48,21 +58,16 @@ class ChordTrainer:
         self.current_chord = random.choice(chord_types)
         return self.current_chord
     
-    def get_frequencies(self) -> List[float]:
+    def get_frequencies(self) -> np.ndarray:
         """Get the frequencies for current chord.
         
         Returns:
-            List of frequencies for chord notes
+            Array of frequencies for chord notes
         """
         if self.current_chord is None:
             raise ValueError("No chord generated yet")
         
-        intervals = self.current_chord.value
-        frequencies = [
-            self.base_freq * (2 ** (semitone / 12)) 
-            for semitone in intervals
-        ]
-        return frequencies
+        return self.base_freq * _CHORD_RATIOS[self.current_chord]
     
     def submit_answer(self, chord_type: ChordType) -> bool:
         """Submit user's chord guess.
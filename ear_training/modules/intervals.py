@@ -1,12 +1,13 @@
 """Interval recognition training module."""
 
 from typing import List, Tuple
-from enum import Enum
+from enum import IntEnum
+import math
 import random
 import numpy as np
 
 
-class Interval(Enum):
+class Interval(IntEnum):
     """Musical intervals."""
     UNISON = 0
     MINOR_SECOND = 1
@@ -47,9 +48,23 @@ class Interval(Enum):
     THREE_OCTAVES = 36
 
 
+# Frequency ratio of every interval, indexed by its semitone count.
+# Whole octaves are applied with ldexp so UNISON and the octave intervals are exact powers of two.
+_RATIO_LUT = tuple(
+    math.ldexp(2.0 ** (semitone / 12), octaves)
+    for octaves, semitone in (divmod(iv.value, 12) for iv in Interval)
+)
+
+# Interval names in semitone order, and lookup of members by name
+INTERVAL_NAMES: Tuple[str, ...] = tuple(iv.name for iv in Interval)
+INTERVAL_BY_NAME: dict[str, Interval] = {iv.name: iv for iv in Interval}
+
+
 class IntervalTrainer:
     """Trains users on interval recognition."""
     
+    __slots__ = ("base_freq", "intervals", "current_interval", "current_direction", "user_answer", "_range_cache")
+    
     def __init__(self, base_freq: float = 440.0):
         """Initialize interval trainer.
         
@@ -61,6 +76,8 @@ class IntervalTrainer:
         self.current_interval: Interval | None = None
         self.current_direction: str = "ascending"  # "ascending" or "descending"
         self.user_answer: Interval | None = None
+        # Intervals available for each requested semitone range, filled on first use
+        self._range_cache: dict[Tuple[int, int], Tuple[Interval, ...]] = {}
     
     def generate_interval(self, 
                          interval_range: Tuple[int, int] | None = None) -> Interval:
@@ -77,28 +94,30 @@ class IntervalTrainer:
         if interval_range is None:
             choices = self.intervals
         else:
-            low, high = interval_range
-            choices = [iv for iv in self.intervals if low <= iv.value <= high]
-            if not choices:
-                raise ValueError("No intervals available in requested range")
+            choices = self._range_cache.get(interval_range)
+            if choices is None:
+                low, high = interval_range
+                choices = tuple(iv for iv in self.intervals if low <= iv.value <= high)
+                if not choices:
+                    raise ValueError("No intervals available in requested range")
+                self._range_cache[interval_range] = choices
         
-        self.current_interval = random.choice(choices)
+        self.current_interval = choices[random.randrange(len(choices))]
         # Randomly choose direction (50% ascending, 50% descending)
-        self.current_direction = random.choice(["ascending", "descending"])
+        self.current_direction = "ascending" if random.getrandbits(1) else "descending"
         return self.current_interval
     
-    def get_frequencies(self) -> Tuple[float, float]:
+    def get_frequencies(self) -> np.ndarray:
         """Get the two frequencies for current interval.
         
         Returns:
-            Tuple of (base_frequency, interval_frequency)
+            Array of [base_frequency, interval_frequency]
         """
         if self.current_interval is None:
             raise ValueError("No interval generated yet")
         
-        semitones = self.current_interval.value
-        freq2 = self.base_freq * (2 ** (semitones / 12))
-        return self.base_freq, freq2
+        freq2 = self.base_freq * _RATIO_LUT[self.current_interval.value]
+        return np.array([self.base_freq, freq2])
     
     def submit_answer(self, interval: Interval) -> bool:
         """Submit user's interval guess.
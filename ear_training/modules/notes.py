@@ -1,11 +1,13 @@
 """Note recognition training module."""
 
 from typing import List
-from enum import Enum
+from enum import IntEnum
+import math
 import random
+import numpy as np
 
 
-class Note(Enum):
+class Note(IntEnum):
     """Musical notes (chromatic scale)."""
     C = 0
     C_SHARP = 1
@@ -40,9 +42,15 @@ class Note(Enum):
         return name_map.get(self.name, self.name)
 
 
+# Frequency ratio of each note relative to A in the same octave
+_NOTE_RATIOS = tuple(2.0 ** ((note.value - Note.A.value) / 12) for note in Note)
+
+
 class NoteTrainer:
     """Trains users on absolute pitch / note recognition."""
     
+    __slots__ = ("base_freq", "octave", "octave_range", "notes", "reference_note", "current_note", "current_octave", "user_answer")
+    
     def __init__(self, base_freq: float = 440.0, octave: int = 4, octave_range: tuple[int, int] | None = None):
         """Initialize note trainer.
         
@@ -73,9 +81,8 @@ class NoteTrainer:
         if octave is None:
             octave = self.octave
         # A4 = 440 Hz is at index 9 (Note.A)
-        # Calculate semitones from A4
-        semitones_from_a4 = note.value - Note.A.value + (octave - 4) * 12
-        frequency = self.base_freq * (2 ** (semitones_from_a4 / 12))
+        # Scale the in-octave ratio from A by whole octaves away from octave 4
+        frequency = math.ldexp(self.base_freq * _NOTE_RATIOS[note.value], octave - 4)
         return frequency
     
     def get_reference_note(self) -> tuple[Note, float]:
@@ -100,23 +107,18 @@ class NoteTrainer:
         
         # If max_interval is specified and we have a previous note, constrain choices
         if max_interval is not None and self.current_note is not None and self.current_octave is not None:
-            # Calculate valid octave range based on max_interval
-            valid_octaves = []
-            valid_notes = []
+            octaves = np.arange(self.octave_range[0], self.octave_range[1] + 1)
+            note_values = np.array([note.value for note in notes_to_choose])
+            prev_semitone = self.current_note.value + (self.current_octave - 4) * 12
             
-            for octave in range(self.octave_range[0], self.octave_range[1] + 1):
-                for note in notes_to_choose:
-                    # Calculate semitone distance
-                    prev_semitone = self.current_note.value + (self.current_octave - 4) * 12
-                    curr_semitone = note.value + (octave - 4) * 12
-                    interval = abs(curr_semitone - prev_semitone)
-                    
-                    # Check if within max interval
-                    if interval <= max_interval:
-                        valid_notes.append((note, octave))
+            # Semitone distance from the previous note for every (octave, note) pair
+            intervals = np.abs(note_values[None, :] + (octaves[:, None] - 4) * 12 - prev_semitone)
+            valid = np.flatnonzero(intervals <= max_interval)
             
-            if valid_notes:
-                self.current_note, self.current_octave = random.choice(valid_notes)
+            if valid.size:
+                octave_idx, note_idx = divmod(int(valid[random.randrange(valid.size)]), len(notes_to_choose))
+                self.current_note = notes_to_choose[note_idx]
+                self.current_octave = int(octaves[octave_idx])
             else:
                 # If no valid notes, fall back to default behavior
                 self.current_note = random.choice(notes_to_choose)
@@ -1,8 +1,11 @@
 """Harmonic progression training module."""
 
-from typing import List, Tuple
+from typing import Collection, List, Tuple
 from enum import Enum
+from functools import lru_cache
+import math
 import random
+import numpy as np
 
 
 class ChordNumber(Enum):
@@ -23,11 +26,248 @@ class ChordNumber(Enum):
     VIM7 = (9, "m7")      # Minor 7th on VI
     VII = (11, "diminished")  # Leading tone
     VIIM7B5 = (11, "m7b5")  # Half-diminished 7th on VII
+    
+    def __new__(cls, root: int, quality: str):
+        obj = object.__new__(cls)
+        obj._value_ = (root, quality)
+        obj.root = root  # Semitones above the tonic
+        obj.quality = quality  # Chord type, e.g. "major" or "m7"
+        return obj
+
+
+# Semitone intervals above the root for each chord quality
+_CHORD_INTERVALS: dict[str, Tuple[int, ...]] = {
+    "major": (0, 4, 7),
+    "minor": (0, 3, 7),
+    "diminished": (0, 3, 6),
+    "augmented": (0, 4, 8),
+    "dominant7": (0, 4, 7, 10),
+    "maj7": (0, 4, 7, 11),
+    "m7": (0, 3, 7, 10),
+    "m7b5": (0, 3, 6, 10),
+}
+
+
+@lru_cache(maxsize=None)
+def _chord_notes(chord: ChordNumber, inversion: int) -> Tuple[int, ...]:
+    """Compute the semitone intervals of a chord in the given inversion.
+    
+    Results are cached, as there are only a few dozen chord/inversion pairs.
+    """
+    root = chord.root
+    chord_intervals = _CHORD_INTERVALS.get(chord.quality, _CHORD_INTERVALS["major"])
+
+    # Apply inversion. For triads (3 notes) we support root, 1st, 2nd inversion.
+    # For seventh chords (4 notes) we support root through 3rd inversion.
+    n = len(chord_intervals)
+    inversion = inversion % n  # safety guard
+
+    if inversion > 0:
+        chord_intervals = chord_intervals[inversion:] + tuple(i + 12 for i in chord_intervals[:inversion])
+
+    return tuple(root + interval for interval in chord_intervals)
+
+
+# Every inversion of every chord as (semitones, sum of semitones), indexed by inversion
+_CHORD_INVERSION_TABLE: dict[ChordNumber, Tuple[Tuple[Tuple[int, ...], int], ...]] = {
+    chord: tuple(
+        (_chord_notes(chord, inversion), sum(_chord_notes(chord, inversion)))
+        for inversion in range(len(_chord_notes(chord, 0)))
+    )
+    for chord in ChordNumber
+}
+
+
+@lru_cache(maxsize=4096)
+def _voice_leading_cost(previous_notes: Tuple[int, ...], next_notes: Tuple[int, ...]) -> Tuple[int, int]:
+    """Find the voice assignment with the least movement between two chords.
+    
+    Every voice of the smaller chord is paired with a distinct voice of the larger one;
+    voices left over cost nothing. Assignments are ranked by pitch-class distance (the
+    nearest octave of each target), then by actual register movement, so inversions of
+    the same chord are told apart by how far the voices really travel.
+    
+    Results are cached: chords only ever come from the small chord/inversion table, so
+    every pair a progression can contain is scored once.
+    
+    Returns:
+        Tuple of (pitch-class distance, register distance) for the best assignment
+    """
+    if len(previous_notes) <= len(next_notes):
+        fewer, more = previous_notes, next_notes
+    else:
+        fewer, more = next_notes, previous_notes
+    
+    costs = []
+    for note in fewer:
+        row = []
+        for other in more:
+            diff = (other - note) % 12
+            row.append((min(diff, 12 - diff), abs(other - note)))
+        costs.append(row)
+    
+    # Dynamic programming over assignments: best[mask] is the cheapest way to place the voices
+    # handled so far onto the voices of the larger chord whose bits are set in mask
+    best = {0: (0, 0)}
+    for row in costs:
+        next_best = {}
+        for mask, (pitch_class_total, register_total) in best.items():
+            for idx, (pitch_class_distance, register_distance) in enumerate(row):
+                bit = 1 << idx
+                if mask & bit:
+                    continue  # This voice is already assigned
+                candidate = (pitch_class_total + pitch_class_distance, register_total + register_distance)
+                current = next_best.get(mask | bit)
+                if current is None or candidate < current:
+                    next_best[mask | bit] = candidate
+        best = next_best
+    return min(best.values())
+
+
+# Semitone table of every chord in every inversion: _CHORD_TABLE[chord, inversion, :length].
+# Triads leave the fourth inversion row and the last column unused.
+_CHORD_INDEX: dict[ChordNumber, int] = {chord: i for i, chord in enumerate(ChordNumber)}
+_CHORD_LENGTHS = np.array([len(_chord_notes(chord, 0)) for chord in ChordNumber], dtype=np.intp)
+_CHORD_TABLE = np.zeros((len(ChordNumber), 4, 4), dtype=np.int8)
+for _chord, _idx in _CHORD_INDEX.items():
+    for _inversion in range(_CHORD_LENGTHS[_idx]):
+        _CHORD_TABLE[_idx, _inversion, :_CHORD_LENGTHS[_idx]] = _chord_notes(_chord, _inversion)
+del _chord, _idx, _inversion
+
+
+# Frequency ratio relative to A4 for each semitone relative to C4 (A is 9 semitones above C),
+# stored at index semitone + _LUT_OFFSET. Covers bass notes an octave down and every chord
+# tone produced by _chord_notes, inversions included.
+_LUT_OFFSET = 12
+_A4_OFFSET_LUT = np.array([2.0 ** ((k - 9) / 12.0) for k in range(-_LUT_OFFSET, 60)], dtype=np.float64)
+
+
+@lru_cache(maxsize=1024)
+def _chord_frequencies(chord: ChordNumber, inversion: int, base_freq: float,
+                       base_octave: int, include_bass_line: bool) -> np.ndarray:
+    """Compute the frequencies of one voiced chord, filled in on first use.
+    
+    Chords, inversions and octaves form a small finite set, so each combination is
+    converted once and the (read-only) array is shared by every later progression.
+    """
+    chord_idx = _CHORD_INDEX[chord]
+    semitones = _CHORD_TABLE[chord_idx, inversion, :_CHORD_LENGTHS[chord_idx]]
+    
+    # Add bass line if requested: add the root note an octave lower as the lowest note
+    if include_bass_line:
+        semitones = np.concatenate(([chord.root - 12], semitones))
+    
+    # Frequency of C in the base octave, scaled by each note's ratio from the A4 lookup table
+    frequencies = math.ldexp(base_freq, base_octave - 4) * _A4_OFFSET_LUT[semitones + _LUT_OFFSET]
+    frequencies.flags.writeable = False
+    return frequencies
+
+
+# Voice leading preferences: chords that may follow each chord
+_VOICE_LEADING: dict[ChordNumber, Tuple[ChordNumber, ...]] = {
+    ChordNumber.I: (ChordNumber.IV, ChordNumber.V, ChordNumber.V7, ChordNumber.VI, ChordNumber.II, ChordNumber.III, ChordNumber.IIIAUG, ChordNumber.III7, ChordNumber.VII, ChordNumber.IMAJ7, ChordNumber.IIM7, ChordNumber.IIIM7, ChordNumber.IVMAJ7, ChordNumber.VIM7, ChordNumber.VIIM7B5),
+    ChordNumber.IMAJ7: (ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.V, ChordNumber.V7, ChordNumber.VI, ChordNumber.VIM7, ChordNumber.II, ChordNumber.IIM7),
+    ChordNumber.II: (ChordNumber.V, ChordNumber.V7, ChordNumber.IV, ChordNumber.VII, ChordNumber.VIIM7B5),
+    ChordNumber.IIM7: (ChordNumber.V, ChordNumber.V7, ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.VII, ChordNumber.VIIM7B5),
+    ChordNumber.III: (ChordNumber.VI, ChordNumber.IIIAUG, ChordNumber.III7, ChordNumber.IV, ChordNumber.I, ChordNumber.VIM7),
+    ChordNumber.IIIM7: (ChordNumber.VI, ChordNumber.VIM7, ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.I),
+    ChordNumber.IIIAUG: (ChordNumber.VI, ChordNumber.III, ChordNumber.III7, ChordNumber.IV, ChordNumber.I),
+    ChordNumber.III7: (ChordNumber.VI, ChordNumber.IV, ChordNumber.I),
+    ChordNumber.IV: (ChordNumber.I, ChordNumber.V, ChordNumber.V7, ChordNumber.II, ChordNumber.IMAJ7, ChordNumber.VII),
+    ChordNumber.IVMAJ7: (ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.V, ChordNumber.V7, ChordNumber.II, ChordNumber.IIM7),
+    ChordNumber.V: (ChordNumber.I, ChordNumber.VI, ChordNumber.IV, ChordNumber.VII, ChordNumber.IMAJ7, ChordNumber.VIM7),
+    ChordNumber.V7: (ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.VIM7, ChordNumber.IV, ChordNumber.VII),
+    ChordNumber.VI: (ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.II, ChordNumber.IIM7, ChordNumber.III, ChordNumber.IIIM7, ChordNumber.IIIAUG, ChordNumber.III7, ChordNumber.VII, ChordNumber.V, ChordNumber.VIM7),
+    ChordNumber.VIM7: (ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.II, ChordNumber.IIM7, ChordNumber.III, ChordNumber.IIIM7),
+    ChordNumber.VII: (ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.VIM7),
+    ChordNumber.VIIM7B5: (ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.VIM7),
+}
+
+_ALL_CHORDS: Tuple[ChordNumber, ...] = tuple(ChordNumber)
+
+# Markov transition table: (successors, cumulative weights) for each chord.
+# Successors are currently equally likely; weighted edges only need new cumulative weights.
+_TRANSITIONS: dict[ChordNumber, Tuple[Tuple[ChordNumber, ...], Tuple[int, ...]]] = {
+    chord: (successors, tuple(range(1, len(successors) + 1)))
+    for chord, successors in _VOICE_LEADING.items()
+}
+_ALL_CHORDS_TRANSITION = (_ALL_CHORDS, tuple(range(1, len(_ALL_CHORDS) + 1)))
+
+# Common progressions for training
+_COMMON_PROGRESSIONS: Tuple[Tuple[ChordNumber, ...], ...] = (
+    (ChordNumber.I, ChordNumber.IV),
+    (ChordNumber.I, ChordNumber.II),
+    (ChordNumber.I, ChordNumber.IV, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.V, ChordNumber.IV),
+    (ChordNumber.I, ChordNumber.VI, ChordNumber.IV, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.IV, ChordNumber.I, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.IV, ChordNumber.V, ChordNumber.I),
+    (ChordNumber.VI, ChordNumber.IV, ChordNumber.I, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.V, ChordNumber.VI, ChordNumber.IV),
+    (ChordNumber.I, ChordNumber.III, ChordNumber.VI, ChordNumber.IV, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.IIIAUG, ChordNumber.VI, ChordNumber.IV, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.II, ChordNumber.V),
+    (ChordNumber.I, ChordNumber.V, ChordNumber.I),
+    # Diatonic 7th chord progressions
+    (ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.IIM7, ChordNumber.V7),
+    (ChordNumber.IMAJ7, ChordNumber.IV, ChordNumber.V7),
+    (ChordNumber.I, ChordNumber.VIM7, ChordNumber.IIM7, ChordNumber.V7),
+    (ChordNumber.IMAJ7, ChordNumber.IVMAJ7, ChordNumber.V7, ChordNumber.IMAJ7),
+    (ChordNumber.I, ChordNumber.VI, ChordNumber.IIM7, ChordNumber.V7),
+    (ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.IV, ChordNumber.V7),
+    # Minor key progressions (vi as minor tonic)
+    (ChordNumber.VI, ChordNumber.IV, ChordNumber.V, ChordNumber.VI),
+    (ChordNumber.VI, ChordNumber.VII, ChordNumber.VI),
+    (ChordNumber.VI, ChordNumber.III, ChordNumber.VII, ChordNumber.VI),
+    (ChordNumber.VI, ChordNumber.IV, ChordNumber.VII),
+    (ChordNumber.VI, ChordNumber.I, ChordNumber.V),
+    (ChordNumber.VI, ChordNumber.II, ChordNumber.V),
+    (ChordNumber.VI, ChordNumber.IV, ChordNumber.I),
+    (ChordNumber.VI, ChordNumber.IV, ChordNumber.V, ChordNumber.VII),
+    (ChordNumber.VI, ChordNumber.II, ChordNumber.VII, ChordNumber.VI),
+    # Minor key progressions with 7th chords (vi as minor tonic)
+    (ChordNumber.VIM7, ChordNumber.IV, ChordNumber.V7, ChordNumber.VIM7),
+    (ChordNumber.VI, ChordNumber.IIM7, ChordNumber.V7, ChordNumber.VI),
+    (ChordNumber.VIM7, ChordNumber.IIM7, ChordNumber.V7),
+    (ChordNumber.VI, ChordNumber.IVMAJ7, ChordNumber.V7, ChordNumber.VI),
+    (ChordNumber.VIM7, ChordNumber.III, ChordNumber.V7, ChordNumber.VI),
+)
+
+_COMMON_PROGRESSION_INDEX: dict[Tuple[ChordNumber, ...], int] = {
+    progression: idx for idx, progression in enumerate(_COMMON_PROGRESSIONS)
+}
+
+# Lookup of chord numbers by enum name
+CHORD_NUMBER_BY_NAME: dict[str, ChordNumber] = {chord.name: chord for chord in ChordNumber}
+
+# Display names that differ from the enum name
+_ROMAN_NAMES: dict[ChordNumber, str] = {
+    ChordNumber.IIIAUG: "III+",
+    ChordNumber.IMAJ7: "Imaj7",
+    ChordNumber.IIM7: "ii7",
+    ChordNumber.IIIM7: "iii7",
+    ChordNumber.IVMAJ7: "IVmaj7",
+    ChordNumber.VIM7: "vi7",
+    ChordNumber.VIIM7B5: "viiø7",
+    # Also maintain case conversions for basic chords
+    ChordNumber.II: "ii",
+    ChordNumber.III: "iii",
+    ChordNumber.VI: "vi",
+    ChordNumber.VII: "vii°",
+}
+
+# Number of voiced progressions kept by ProgressionTrainer.get_progression_frequencies
+_FREQ_CACHE_SIZE = 64
+
+# Number of (chord, previous notes) inversion choices kept by ProgressionTrainer
+_INV_CACHE_SIZE = 256
 
 
 class ProgressionTrainer:
     """Trains users on harmonic chord progressions with proper voice leading."""
     
+    __slots__ = ("base_freq", "current_progression", "user_answer", "last_progression", "last_tonic_inversion", "common_progressions", "_freq_cache", "_inv_cache", "_last_common_idx")
+    
     def __init__(self, base_freq: float = 440.0):
         """Initialize progression trainer.
         
@@ -39,50 +279,17 @@ class ProgressionTrainer:
         self.user_answer: List[ChordNumber] | None = None
         self.last_progression: List[ChordNumber] | None = None
         self.last_tonic_inversion: int | None = None
-        
-        # Common progressions for training
-        self.common_progressions = [
-            [ChordNumber.I, ChordNumber.IV],
-            [ChordNumber.I, ChordNumber.II],
-
-
-            [ChordNumber.I, ChordNumber.IV, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.V, ChordNumber.IV],
-            [ChordNumber.I, ChordNumber.VI, ChordNumber.IV, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.IV, ChordNumber.I, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.IV, ChordNumber.V, ChordNumber.I],
-            [ChordNumber.VI, ChordNumber.IV, ChordNumber.I, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.V, ChordNumber.VI, ChordNumber.IV],
-            [ChordNumber.I, ChordNumber.III, ChordNumber.VI, ChordNumber.IV, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.IIIAUG, ChordNumber.VI, ChordNumber.IV, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.II, ChordNumber.V],
-            [ChordNumber.I, ChordNumber.V, ChordNumber.I],
-            # Diatonic 7th chord progressions
-            [ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.IIM7, ChordNumber.V7],
-            [ChordNumber.IMAJ7, ChordNumber.IV, ChordNumber.V7],
-            [ChordNumber.I, ChordNumber.VIM7, ChordNumber.IIM7, ChordNumber.V7],
-            [ChordNumber.IMAJ7, ChordNumber.IVMAJ7, ChordNumber.V7, ChordNumber.IMAJ7],
-            [ChordNumber.I, ChordNumber.VI, ChordNumber.IIM7, ChordNumber.V7],
-            [ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.IV, ChordNumber.V7],
-            # Minor key progressions (vi as minor tonic)
-            [ChordNumber.VI, ChordNumber.IV, ChordNumber.V, ChordNumber.VI],
-            [ChordNumber.VI, ChordNumber.VII, ChordNumber.VI],
-            [ChordNumber.VI, ChordNumber.III, ChordNumber.VII, ChordNumber.VI],
-            [ChordNumber.VI, ChordNumber.IV, ChordNumber.VII],
-            [ChordNumber.VI, ChordNumber.I, ChordNumber.V],
-            [ChordNumber.VI, ChordNumber.II, ChordNumber.V],
-            [ChordNumber.VI, ChordNumber.IV, ChordNumber.I],
-            [ChordNumber.VI, ChordNumber.IV, ChordNumber.V, ChordNumber.VII],
-            [ChordNumber.VI, ChordNumber.II, ChordNumber.VII, ChordNumber.VI],
-            # Minor key progressions with 7th chords (vi as minor tonic)
-            [ChordNumber.VIM7, ChordNumber.IV, ChordNumber.V7, ChordNumber.VIM7],
-            [ChordNumber.VI, ChordNumber.IIM7, ChordNumber.V7, ChordNumber.VI],
-            [ChordNumber.VIM7, ChordNumber.IIM7, ChordNumber.V7],
-            [ChordNumber.VI, ChordNumber.IVMAJ7, ChordNumber.V7, ChordNumber.VI],
-            [ChordNumber.VIM7, ChordNumber.III, ChordNumber.V7, ChordNumber.VI],
-        ]
+        # Frequencies of recently voiced progressions, with the tonic inversion each one chose
+        self._freq_cache: dict[tuple, Tuple[List[np.ndarray], int | None]] = {}
+        self._inv_cache: dict[Tuple[ChordNumber, Tuple[int, ...]], int] = {}
+        
+        # Common progressions for training (shared, immutable)
+        self.common_progressions = _COMMON_PROGRESSIONS
+        # Index of the last progression if it is a common one, so it can be skipped next time
+        self._last_common_idx: int | None = None
     
-    def generate_progression(self, num_chords: int | None = None, start_on_tonic: bool = True, use_common_only: bool = False) -> List[ChordNumber]:
+    def generate_progression(self, num_chords: int | None = None, start_on_tonic: bool = True, use_common_only: bool = False,
+                             excluded: Collection[ChordNumber] = ()) -> List[ChordNumber]:
         """Generate a random chord progression.
         
         Args:
@@ -92,15 +299,31 @@ class ProgressionTrainer:
                            If False, progression can start on any chord.
             use_common_only: If True, select from predefined common progressions.
                             If False, generate progressions probabilistically.
+            excluded: Chords to leave out. They are only used where no other chord
+                      fits (such as the tonic when start_on_tonic is set).
         
         Returns:
             List of ChordNumber enums representing the progression
         """
         if use_common_only:
             # Select a random common progression that differs from the last one
-            progression = random.choice(self.common_progressions)
-            while progression == self.last_progression:
-                progression = random.choice(self.common_progressions)
+            n = len(self.common_progressions)
+            last_idx = self._last_common_idx
+            allowed = None
+            if excluded:
+                allowed = [i for i, progression in enumerate(self.common_progressions)
+                           if i != last_idx and not any(chord in excluded for chord in progression)]
+            if allowed:
+                idx = allowed[random.randrange(len(allowed))]
+            elif last_idx is not None and n > 1:
+                # Draw from every index except the last one
+                idx = random.randrange(n - 1)
+                if idx >= last_idx:
+                    idx += 1
+            else:
+                idx = random.randrange(n)
+            self._last_common_idx = idx
+            progression = list(self.common_progressions[idx])
             self.last_progression = progression
             self.current_progression = progression
             return progression
@@ -108,30 +331,41 @@ class ProgressionTrainer:
         if num_chords is None:
             num_chords = random.randint(2, 5)
         
-        # Generate progression, ensuring it differs from the last one
-        while True:
-            # Start with tonic or random chord based on parameter
-            if start_on_tonic:
-                progression = [ChordNumber.I]
+        # Start with tonic or random chord based on parameter
+        if start_on_tonic:
+            progression = [ChordNumber.I]
+        else:
+            first_chords = [c for c in _ALL_CHORDS if c not in excluded] or _ALL_CHORDS
+            progression = [first_chords[random.randrange(len(first_chords))]]
+        
+        # Generate remaining chords with voice leading constraints
+        while len(progression) < num_chords:
+            last_chord = progression[-1]
+            # Choose next chord based on voice leading principles
+            next_chord = self._choose_next_chord(last_chord, excluded)
+            progression.append(next_chord)
+        
+        # Ensure it differs from the last one by swapping the final chord for another
+        # allowed successor, which keeps the voice leading valid without regenerating
+        if progression == self.last_progression:
+            if len(progression) > 1:
+                candidates = _VOICE_LEADING.get(progression[-2], _ALL_CHORDS)
+            elif not start_on_tonic:
+                candidates = _ALL_CHORDS
             else:
-                progression = [random.choice(list(ChordNumber))]
-            
-            # Generate remaining chords with voice leading constraints
-            while len(progression) < num_chords:
-                last_chord = progression[-1]
-                # Choose next chord based on voice leading principles
-                next_chord = self._choose_next_chord(last_chord)
-                progression.append(next_chord)
-            
-            # Check if this progression is different from the last one
-            if progression != self.last_progression:
-                break
+                candidates = ()
+            alternatives = [c for c in candidates if c is not progression[-1]]
+            alternatives = [c for c in alternatives if c not in excluded] or alternatives
+            if alternatives:
+                progression[-1] = alternatives[random.randrange(len(alternatives))]
         
+        self._last_common_idx = _COMMON_PROGRESSION_INDEX.get(tuple(progression))
         self.last_progression = progression
         self.current_progression = progression
         return progression
     
-    def _choose_next_chord(self, current_chord: ChordNumber) -> ChordNumber:
+    def _choose_next_chord(self, current_chord: ChordNumber,
+                           excluded: Collection[ChordNumber] = ()) -> ChordNumber:
         """Choose the next chord with proper voice leading.
         
         Voice leading principles:
@@ -141,36 +375,22 @@ class ProgressionTrainer:
         
         Args:
             current_chord: Current chord number
+            excluded: Chords to avoid unless every allowed successor is excluded
         
         Returns:
             Next chord number
         """
-        current_root = current_chord.value[0]
-        
-        # Voice leading preferences based on current chord
-        voice_leading_preferences = {
-            ChordNumber.I: [ChordNumber.IV, ChordNumber.V, ChordNumber.V7, ChordNumber.VI, ChordNumber.II, ChordNumber.III, ChordNumber.IIIAUG, ChordNumber.III7, ChordNumber.VII, ChordNumber.IMAJ7, ChordNumber.IIM7, ChordNumber.IIIM7, ChordNumber.IVMAJ7, ChordNumber.VIM7, ChordNumber.VIIM7B5],
-            ChordNumber.IMAJ7: [ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.V, ChordNumber.V7, ChordNumber.VI, ChordNumber.VIM7, ChordNumber.II, ChordNumber.IIM7],
-            ChordNumber.II: [ChordNumber.V, ChordNumber.V7, ChordNumber.IV, ChordNumber.VII, ChordNumber.VIIM7B5],
-            ChordNumber.IIM7: [ChordNumber.V, ChordNumber.V7, ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.VII, ChordNumber.VIIM7B5],
-            ChordNumber.III: [ChordNumber.VI, ChordNumber.IIIAUG, ChordNumber.III7, ChordNumber.IV, ChordNumber.I, ChordNumber.VIM7],
-            ChordNumber.IIIM7: [ChordNumber.VI, ChordNumber.VIM7, ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.I],
-            ChordNumber.IIIAUG: [ChordNumber.VI, ChordNumber.III, ChordNumber.III7, ChordNumber.IV, ChordNumber.I],
-            ChordNumber.III7: [ChordNumber.VI, ChordNumber.IV, ChordNumber.I],
-            ChordNumber.IV: [ChordNumber.I, ChordNumber.V, ChordNumber.V7, ChordNumber.II, ChordNumber.IMAJ7, ChordNumber.VII],
-            ChordNumber.IVMAJ7: [ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.V, ChordNumber.V7, ChordNumber.II, ChordNumber.IIM7],
-            ChordNumber.V: [ChordNumber.I, ChordNumber.VI, ChordNumber.IV, ChordNumber.VII, ChordNumber.IMAJ7, ChordNumber.VIM7],
-            ChordNumber.V7: [ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.VIM7, ChordNumber.IV, ChordNumber.VII],
-            ChordNumber.VI: [ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.II, ChordNumber.IIM7, ChordNumber.III, ChordNumber.IIIM7, ChordNumber.IIIAUG, ChordNumber.III7, ChordNumber.VII, ChordNumber.V, ChordNumber.VIM7],
-            ChordNumber.VIM7: [ChordNumber.IV, ChordNumber.IVMAJ7, ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.II, ChordNumber.IIM7, ChordNumber.III, ChordNumber.IIIM7],
-            ChordNumber.VII: [ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.VIM7],
-            ChordNumber.VIIM7B5: [ChordNumber.I, ChordNumber.IMAJ7, ChordNumber.VI, ChordNumber.VIM7],
-        }
-        
-        preferred_chords = voice_leading_preferences.get(current_chord, list(ChordNumber))
-        return random.choice(preferred_chords)
+        preferred_chords, cum_weights = _TRANSITIONS.get(current_chord, _ALL_CHORDS_TRANSITION)
+        if excluded:
+            # Mask excluded successors out of the distribution, keeping the others' weights
+            weights = [w - prev for w, prev in zip(cum_weights, (0,) + cum_weights[:-1])]
+            allowed = [(c, w) for c, w in zip(preferred_chords, weights) if c not in excluded]
+            if allowed:
+                chords, weights = zip(*allowed)
+                return random.choices(chords, weights=weights)[0]
+        return random.choices(preferred_chords, cum_weights=cum_weights)[0]
     
-    def get_chord_notes(self, chord: ChordNumber, inversion: int = 0) -> List[int]:
+    def get_chord_notes(self, chord: ChordNumber, inversion: int = 0) -> Tuple[int, ...]:
         """Get the semitone intervals for a chord.
         
         Args:
@@ -178,40 +398,14 @@ class ProgressionTrainer:
             inversion: 0 for root position, 1 for first inversion, 2 for second inversion
         
         Returns:
-            List of semitone intervals from root
+            Tuple of semitone intervals from root
         """
-        root = chord.value[0]
-        chord_type = chord.value[1]
-        
-        # Define intervals for each chord type
-        intervals = {
-            "major": [0, 4, 7],
-            "minor": [0, 3, 7],
-            "diminished": [0, 3, 6],
-            "augmented": [0, 4, 8],
-            "dominant7": [0, 4, 7, 10],
-            "maj7": [0, 4, 7, 11],
-            "m7": [0, 3, 7, 10],
-            "m7b5": [0, 3, 6, 10],
-        }
-
-        chord_intervals = intervals.get(chord_type, [0, 4, 7])
-
-        # Apply inversion. For triads (3 notes) we support root, 1st, 2nd inversion.
-        # For seventh chords (4 notes) we support root through 3rd inversion.
-        n = len(chord_intervals)
-        inversion = inversion % n  # safety guard
-
-        if inversion > 0:
-            rotated = chord_intervals[inversion:] + [i + 12 for i in chord_intervals[:inversion]]
-            chord_intervals = rotated
-
-        return [root + interval for interval in chord_intervals]
+        return _chord_notes(chord, inversion)
     
     def get_progression_frequencies(self, 
                                    base_octave: int = 4,
                                    use_inversions: bool = True,
-                                   include_bass_line: bool = False) -> List[List[float]]:
+                                   include_bass_line: bool = False) -> List[np.ndarray]:
         """Get frequencies for all chords in current progression with voice leading.
         
         Args:
@@ -220,57 +414,69 @@ class ProgressionTrainer:
             include_bass_line: If True, add the root note an octave lower as an additional bass note
         
         Returns:
-            List of frequency lists, one per chord in progression
+            List of frequency arrays, one per chord in progression
         """
         if self.current_progression is None:
             raise ValueError("No progression generated yet")
         
-        all_frequencies = []
+        progression = self.current_progression
+        if not progression:
+            return []
+        
+        # The tonic inversion depends on the previous one, so it is part of the key and
+        # restored on a hit, exactly as a fresh computation would leave it
+        cache_key = (tuple(progression), self.base_freq, base_octave, use_inversions,
+                     include_bass_line, self.last_tonic_inversion)
+        cached = self._freq_cache.get(cache_key)
+        if cached is not None:
+            all_frequencies, self.last_tonic_inversion = cached
+            return list(all_frequencies)
+        
+        # Pick every chord's inversion first; voice leading only needs the semitones
+        inversions = []
         previous_notes = None
-        
-        for i, chord in enumerate(self.current_progression):
+        for i, chord in enumerate(progression):
             inversion = 0
             
             # For the first chord (tonic), select an inversion based on the second chord
-            if i == 0 and len(self.current_progression) > 1:
-                next_chord = self.current_progression[1]
+            if i == 0 and len(progression) > 1:
+                next_chord = progression[1]
                 inversion = self._select_best_inversion_for_next(chord, next_chord, base_octave)
             # For subsequent chords, determine best inversion for voice leading if enabled
             elif use_inversions and previous_notes is not None:
                 inversion = self._select_best_inversion(chord, previous_notes, base_octave)
             
-            chord_notes = self.get_chord_notes(chord, inversion)
-            
-            # Convert semitone intervals to frequencies
-            frequencies = []
-            for note_semitone in chord_notes:
-                # Adjust octave for higher notes
-                octave = base_octave + (note_semitone // 12)
-                note_in_octave = note_semitone % 12
-                
-                # Calculate frequency from A4 (440 Hz)
-                semitones_from_a4 = (octave - 4) * 12 + note_in_octave - 9  # A=9 semitones from C
-                frequency = self.base_freq * (2 ** (semitones_from_a4 / 12))
-                frequencies.append(frequency)
-            
-            # Don't sort frequencies - maintain voice leading relationships
-            # Each voice should move to the nearest note in the next chord
-            
-            # Add bass line if requested: add the root note an octave lower
-            if include_bass_line:
-                root_semitone = self.get_chord_notes(chord, 0)[0]
-                # Calculate bass frequency (root lowered by one octave)
-                bass_octave = base_octave - 1
-                octave = bass_octave + (root_semitone // 12)
-                note_in_octave = root_semitone % 12
-                semitones_from_a4 = (octave - 4) * 12 + note_in_octave - 9
-                bass_frequency = self.base_freq * (2 ** (semitones_from_a4 / 12))
-                frequencies.insert(0, bass_frequency)  # Add bass as lowest note
-            
-            all_frequencies.append(frequencies)
-            previous_notes = chord_notes  # Track for voice leading on next chord
+            inversions.append(inversion)
+            previous_notes = self.get_chord_notes(chord, inversion)  # Track for voice leading on next chord
+        
+        # Look up each voiced chord in the shared frequency table.
+        # Don't sort frequencies - maintain voice leading relationships
+        # Each voice should move to the nearest note in the next chord
+        all_frequencies = [
+            _chord_frequencies(chord, inversion, self.base_freq, base_octave, include_bass_line)
+            for chord, inversion in zip(progression, inversions)
+        ]
+        
+        if len(self._freq_cache) >= _FREQ_CACHE_SIZE:
+            del self._freq_cache[next(iter(self._freq_cache))]  # Evict the oldest entry
+        self._freq_cache[cache_key] = (all_frequencies, self.last_tonic_inversion)
+        return list(all_frequencies)
+    
+    def get_all_frequencies(self, base_octave: int = 4) -> np.ndarray:
+        """Get every frequency a voiced chord can contain, bass notes included.
+        
+        Args:
+            base_octave: Octave for tonic note
         
-        return all_frequencies
+        Returns:
+            Sorted array of the distinct frequencies over all chords and inversions
+        """
+        return np.unique(np.concatenate([
+            _chord_frequencies(chord, inversion, self.base_freq, base_octave, include_bass_line)
+            for chord in ChordNumber
+            for inversion in range(_CHORD_LENGTHS[_CHORD_INDEX[chord]])
+            for include_bass_line in (False, True)
+        ]))
     
     def _select_best_inversion_for_next(self, 
                                         chord: ChordNumber,
@@ -288,25 +494,18 @@ class ProgressionTrainer:
             Best inversion (0, 1, or 2)
         """
         best_inversion = 0
-        best_distance = float('inf')
         
-        # Get average note of next chord in root position
-        next_chord_notes = self.get_chord_notes(next_chord, 0)
-        next_avg = sum(next_chord_notes) / len(next_chord_notes)
-
-        # Determine how many inversions this chord supports (triad vs seventh)
-        base_notes = self.get_chord_notes(chord, 0)
-        num_inversions = len(base_notes)  # 3 for triads, 4 for sevenths
+        # Compare chord averages scaled by both chord sizes so distances are exact integers
+        chord_inversions = _CHORD_INVERSION_TABLE[chord]
+        next_notes, next_sum = _CHORD_INVERSION_TABLE[next_chord][0]
+        next_total = next_sum * len(chord_inversions)
+        scale = len(next_notes)
 
         # Collect all inversions with their distances
-        inversions_with_distance = []
-        for inversion in range(num_inversions):
-            chord_notes = self.get_chord_notes(chord, inversion)
-            current_avg = sum(chord_notes) / len(chord_notes)
-            
-            # Calculate distance
-            distance = abs(current_avg - next_avg)
-            inversions_with_distance.append((inversion, distance))
+        inversions_with_distance = [
+            (inversion, abs(note_sum * scale - next_total))
+            for inversion, (_, note_sum) in enumerate(chord_inversions)
+        ]
         
         # Sort by distance
         inversions_with_distance.sort(key=lambda x: x[1])
@@ -330,7 +529,7 @@ class ProgressionTrainer:
                                previous_notes: List[int],
                                base_octave: int) -> int:
         """Select the inversion that minimizes voice leading distance.
-        Uses optimal voice assignment: each voice moves to its nearest note in the next chord.
+        Uses the optimal voice assignment, breaking pitch-class ties by register movement.
         
         Args:
             chord: Current chord
@@ -340,72 +539,23 @@ class ProgressionTrainer:
         Returns:
             Best inversion (0, 1, or 2)
         """
-        base_notes = self.get_chord_notes(chord, 0)
-        num_inversions = len(base_notes)
-        
-        best_inversion = 0
-        best_total_distance = float('inf')
-        
-        # Try each inversion and calculate optimal voice leading distances
-        for inversion in range(num_inversions):
-            chord_notes = self.get_chord_notes(chord, inversion)
-            
-            # Calculate total voice leading distance using optimal assignment
-            # Each voice finds its nearest note in the next chord
-            total_distance = self._calculate_optimal_voice_distance(previous_notes, chord_notes)
-            
-            if total_distance < best_total_distance:
-                best_total_distance = total_distance
-                best_inversion = inversion
-        
+        previous_notes = tuple(previous_notes)
+        cache_key = (chord, previous_notes)
+        cached = self._inv_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Try each inversion; equal costs keep the lowest inversion, so the choice is deterministic
+        best_inversion = min(
+            range(len(_CHORD_INVERSION_TABLE[chord])),
+            key=lambda inversion: (_voice_leading_cost(previous_notes, _CHORD_INVERSION_TABLE[chord][inversion][0]), inversion),
+        )
+        
+        if len(self._inv_cache) >= _INV_CACHE_SIZE:
+            del self._inv_cache[next(iter(self._inv_cache))]  # Evict the oldest entry
+        self._inv_cache[cache_key] = best_inversion
         return best_inversion
     
-    def _calculate_optimal_voice_distance(self, previous_notes: List[int], next_notes: List[int]) -> float:
-        """Calculate optimal voice leading distance by assigning each voice to its nearest target.
-        
-        For each current note, find the closest next note (considering octave equivalence).
-        This ensures A4 moves to B4 (9+2=11 semitones, i.e. +2), not B5 or B3.
-        
-        Args:
-            previous_notes: Semitone intervals of current chord
-            next_notes: Semitone intervals of next chord
-        
-        Returns:
-            Total voice leading distance
-        """
-        total_distance = 0
-        assigned_indices = set()
-        
-        # For each voice in the previous chord, find the nearest available note in the next chord
-        for prev_note in previous_notes:
-            best_next_idx = -1
-            best_distance = float('inf')
-            
-            # For each voice in the next chord
-            for next_idx, next_note in enumerate(next_notes):
-                if next_idx in assigned_indices:
-                    continue  # This voice is already assigned
-                
-                # Calculate distance considering octave equivalence
-                # Find distance to next_note's class in nearby octaves
-                note_class = next_note % 12
-                prev_class = prev_note % 12
-                
-                # Try different octaves for the next note
-                for octave_offset in range(-2, 3):  # Check octaves -2 to +2
-                    target_note = next_note + (octave_offset * 12)
-                    distance = abs(target_note - prev_note)
-                    
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_next_idx = next_idx
-            
-            if best_next_idx >= 0:
-                assigned_indices.add(best_next_idx)
-                total_distance += best_distance
-        
-        return total_distance
-    
     def submit_answer(self, user_progression: List[ChordNumber]) -> bool:
         """Submit user's progression guess.
         
@@ -431,18 +581,4 @@ class ProgressionTrainer:
         Returns:
             String like "I - IV - V - I"
         """
-        name_map = {
-            ChordNumber.IIIAUG: "III+",
-            ChordNumber.IMAJ7: "Imaj7",
-            ChordNumber.IIM7: "ii7",
-            ChordNumber.IIIM7: "iii7",
-            ChordNumber.IVMAJ7: "IVmaj7",
-            ChordNumber.VIM7: "vi7",
-            ChordNumber.VIIM7B5: "viiø7",
-            # Also maintain case conversions for basic chords
-            ChordNumber.II: "ii",
-            ChordNumber.III: "iii",
-            ChordNumber.VI: "vi",
-            ChordNumber.VII: "vii°",
-        }
-        return " - ".join([name_map.get(chord, chord.name) for chord in progression])
+        return " - ".join(_ROMAN_NAMES.get(chord, chord.name) for chord in progression)
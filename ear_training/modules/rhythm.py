@@ -2,8 +2,10 @@
 
 from typing import List, Tuple
 from enum import Enum
+from functools import lru_cache
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 
 
 class NoteValue(Enum):
@@ -17,17 +19,35 @@ class NoteValue(Enum):
     TRIPLET_EIGHTH = 1.0 / 6
 
 
+# Durations counted in twelfths of a beat, the finest grid shared by every NoteValue
+# (sixteenths and both triplets), so patterns are filled with exact integer arithmetic
+_TICKS_PER_BEAT = 12
+_NOTE_TICKS: dict[NoteValue, int] = {note: round(note.value * _TICKS_PER_BEAT) for note in NoteValue}
+
+
+@lru_cache(maxsize=None)
+def _fitting_notes(allowed_notes: Tuple[NoteValue, ...], remaining_ticks: int) -> Tuple[NoteValue, ...]:
+    """Get the allowed note values that fit into the remaining ticks."""
+    return tuple(note for note in allowed_notes if _NOTE_TICKS[note] <= remaining_ticks)
+
+
 @dataclass
 class RhythmPattern:
     """Represents a rhythm pattern."""
-    notes: List[NoteValue]
+    notes: Tuple[NoteValue, ...]
     tempo: int  # BPM
     time_signature: Tuple[int, int]  # (numerator, denominator)
+    _values: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Freeze the notes so the cached beat values cannot go stale
+        self.notes = tuple(self.notes)
+        self._values = np.fromiter((note.value for note in self.notes), dtype=np.float64, count=len(self.notes))
     
     def duration_in_seconds(self) -> float:
         """Calculate total duration in seconds."""
         beat_duration = 60 / self.tempo  # seconds per beat
-        total_beats = sum(note.value for note in self.notes)
+        total_beats = float(self._values.sum())
         return total_beats * beat_duration
 
 
@@ -63,24 +83,20 @@ class RhythmTrainer:
             allowed_notes = [NoteValue.QUARTER, NoteValue.EIGHTH, NoteValue.HALF]
         
         notes = []
-        remaining_beats = length
+        allowed = tuple(allowed_notes)
+        remaining_ticks = round(length * _TICKS_PER_BEAT)
         
-        while remaining_beats > 0:
-            note = random.choice(allowed_notes)
-            if note.value <= remaining_beats:
-                notes.append(note)
-                remaining_beats -= note.value
-            else:
-                # Try to fit remaining beats
-                allowed_notes_filtered = [n for n in allowed_notes if n.value <= remaining_beats]
-                if not allowed_notes_filtered:
-                    break
-                note = random.choice(allowed_notes_filtered)
-                notes.append(note)
-                remaining_beats -= note.value
+        # Only pick from notes that still fit, so no draw is ever rejected
+        while remaining_ticks > 0:
+            candidates = _fitting_notes(allowed, remaining_ticks)
+            if not candidates:
+                break
+            note = candidates[random.randrange(len(candidates))]
+            notes.append(note)
+            remaining_ticks -= _NOTE_TICKS[note]
         
         self.current_pattern = RhythmPattern(
-            notes=notes,
+            notes=tuple(notes),
             tempo=self.tempo,
             time_signature=time_signature
         )
@@ -99,7 +115,7 @@ class RhythmTrainer:
             raise ValueError("No pattern generated yet")
         
         self.user_answer = pattern
-        return pattern == self.current_pattern.notes
+        return tuple(pattern) == self.current_pattern.notes
     
     def get_current_pattern(self) -> RhythmPattern | None:
         """Get current pattern being trained."""
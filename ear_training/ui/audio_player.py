@@ -1,11 +1,139 @@
 """Audio playback utilities using pygame."""
 
-from typing import List
+from fractions import Fraction
+from typing import Callable, Sequence
+import math
+import threading
 import numpy as np
 try:
     import pygame
 except ImportError:
     pygame = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Mixer buffer size in sample frames (about 46 ms at 44.1 kHz), large enough to avoid underruns
+_MIXER_BUFFER = 2048
+
+# Number of synthesised tones and chords kept ready to play by AudioPlayer
+_SOUND_CACHE_SIZE = 256
+
+# Number of single-tone waveforms kept for mixing into sequences, timelines and chords
+_TONE_CACHE_SIZE = 128
+
+# Per-instrument harmonic ratios, their amplitudes and ADSR envelope (attack, decay, sustain, release)
+_INSTRUMENTS: dict[str, tuple[np.ndarray, np.ndarray, tuple[float, float, float, float] | None]] = {
+    # Piano: rich harmonics that decay; quick attack, long decay
+    "piano": (
+        np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32),  # Fundamental, octave, twelfth, double octave
+        np.array([1.0, 0.6, 0.3, 0.2], dtype=np.float32),
+        (0.01, 0.3, 0.2, 0.2),
+    ),
+    # Bell: inharmonic partials, long sustain, very different sound
+    "bell": (
+        np.array([0.9, 1.2, 2.1, 3.5], dtype=np.float32),  # Slightly lower fundamental, then inharmonic partials
+        np.array([0.5, 0.7, 0.6, 0.4], dtype=np.float32),
+        (0.15, 0.1, 0.8, 0.3),
+    ),
+    # Violin: bright, sustained, many harmonics (strong 2nd and 3rd)
+    "violin": (
+        np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], dtype=np.float32),
+        np.array([1.0, 0.9, 0.7, 0.5, 0.3, 0.2], dtype=np.float32),
+        (0.03, 0.05, 0.9, 0.1),
+    ),
+    # Flute: mellow, mostly fundamental, soft attack
+    "flute": (
+        np.array([1.0, 2.0, 3.0], dtype=np.float32),
+        np.array([1.0, 0.2, 0.05], dtype=np.float32),
+        (0.15, 0.02, 0.85, 0.08),
+    ),
+}
+
+# Default: simple sine with a flat envelope
+_DEFAULT_INSTRUMENT = (np.array([1.0], dtype=np.float32), np.array([1.0], dtype=np.float32), None)
+
+# Points per fundamental cycle used to locate each instrument's waveform peak
+_PEAK_RESOLUTION = 4096
+
+
+def _waveform_peak(ratios: np.ndarray, amplitudes: np.ndarray) -> float:
+    """Peak of sum(a * sin(2*pi*r*x)) over one full period of the combined partials.
+    
+    The waveform shape does not depend on the fundamental, so normalising by this
+    peak matches normalising each tone by its own maximum, without scanning it.
+    """
+    period = math.lcm(*(Fraction(float(ratio)).limit_denominator(100).denominator for ratio in ratios))
+    x = np.arange(period * _PEAK_RESOLUTION) / _PEAK_RESOLUTION
+    waveform = amplitudes.astype(np.float64) @ np.sin(2 * np.pi * np.multiply.outer(ratios.astype(np.float64), x))
+    return float(np.max(np.abs(waveform)))
+
+
+# Output gain per instrument: normalise to the waveform peak, then scale to 0.6 for less aggressive synthesis
+_INSTRUMENT_GAINS: dict[str, float] = {
+    name: 0.6 / _waveform_peak(ratios, amplitudes) for name, (ratios, amplitudes, _) in _INSTRUMENTS.items()
+}
+_DEFAULT_GAIN = 0.6
+
+# Number of time axes (one per tone length) kept by AudioPlayer._time_axis
+_TIME_AXIS_CACHE_SIZE = 16
+
+# Number of gain-scaled envelopes (one per tone length and instrument) kept by AudioPlayer._tone_envelope
+_ENVELOPE_CACHE_SIZE = 32
+
+# Envelope parameters equivalent to no envelope: no attack, decay or release at full sustain
+_FLAT_ADSR = (0.0, 0.0, 1.0, 0.0)
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _synth_kernel(frequency, ratios, amplitudes, num_samples, sample_rate, gain,
+                      attack, decay, sustain, release):
+        """Sum the harmonics and apply the ADSR envelope and gain in a single pass.
+        
+        Mirrors the numpy path of AudioPlayer.generate_rich_tone without its temporaries.
+        """
+        waveform = np.empty(num_samples, dtype=np.float32)
+        omega = 2.0 * math.pi * frequency / sample_rate
+        decay_end = attack + decay
+        release_start = (num_samples - 1) / sample_rate - release
+        for i in range(num_samples):
+            value = 0.0
+            for k in range(ratios.shape[0]):
+                value += amplitudes[k] * math.sin(omega * ratios[k] * i)
+            
+            t = i / sample_rate
+            # Later phases take precedence where they overlap, as in _adsr_envelope
+            if release > 0 and t > release_start:
+                envelope = sustain * max(0.0, 1.0 - (t - release_start) / release)
+            elif decay_end < t <= release_start:
+                envelope = sustain
+            elif decay > 0 and attack < t <= decay_end:
+                envelope = 1.0 - (1.0 - sustain) * ((t - attack) / decay)
+            elif attack > 0 and t <= attack:
+                envelope = t / attack
+            else:
+                envelope = 1.0
+            waveform[i] = value * envelope * gain
+        return waveform
+else:
+    _synth_kernel = None
+
+def init_audio(sample_rate: int = 44100) -> None:
+    """Open the pygame mixer shared by every AudioPlayer, unless it is already open.
+    
+    Args:
+        sample_rate: Audio sample rate in Hz
+    """
+    if pygame is None or pygame.mixer.get_init() is not None:
+        return
+    # Tones are mono, so a mono mixer avoids duplicating every sample into two channels
+    pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=_MIXER_BUFFER)
+
 
 class AudioPlayer:
     """Handles audio synthesis and playback with instrument-like sounds."""
@@ -19,8 +147,18 @@ class AudioPlayer:
         """
         self.sample_rate = sample_rate
         self.duration = duration
-        if pygame is not None:
-            pygame.mixer.init(frequency=sample_rate, size=-16, channels=2)
+        self._sound_cache: dict[tuple, "pygame.mixer.Sound"] = {}
+        self._tone_cache: dict[tuple, np.ndarray] = {}
+        self._t_cache: dict[int, np.ndarray] = {}
+        self._envelope_cache: dict[tuple[int, str | None], np.ndarray] = {}
+        # Reusable working memory for synthesis temporaries, grown on demand and shared
+        # between threads (the web app serves requests concurrently) under a lock
+        self._scratch = np.empty(0, dtype=np.float32)
+        self._pcm_scratch = np.empty(0, dtype=np.int16)
+        self._scratch_lock = threading.Lock()
+        # Guards the eviction and insertion of cache entries (GUI playback runs on worker threads)
+        self._cache_lock = threading.Lock()
+        init_audio(sample_rate)
     
     def generate_sine_wave(self, frequency: float, 
                           duration: float | None = None) -> np.ndarray:
@@ -36,9 +174,10 @@ class AudioPlayer:
         if duration is None:
             duration = self.duration
         
-        samples = np.arange(int(self.sample_rate * duration))
-        waveform = np.sin(2 * np.pi * frequency * samples / self.sample_rate)
-        return waveform * 0.3  # Scale to prevent clipping
+        waveform = self._time_axis(int(self.sample_rate * duration)) * (2 * np.pi * frequency)
+        np.sin(waveform, out=waveform)
+        waveform *= 0.3  # Scale to prevent clipping
+        return waveform
     
     def generate_rich_tone(self, frequency: float, 
                           duration: float | None = None,
@@ -57,75 +196,211 @@ class AudioPlayer:
             duration = self.duration
         
         num_samples = int(self.sample_rate * duration)
-        samples = np.arange(num_samples)
-        t = samples / self.sample_rate
-        
-        # Start with fundamental
-        waveform = np.zeros(num_samples)
-        
-        if instrument == "piano":
-            # Piano: rich harmonics that decay
-            harmonics = [
-                (1.0, 1.0),      # Fundamental
-                (2.0, 0.6),      # Octave
-                (3.0, 0.3),      # Twelfth
-                (4.0, 0.2),      # Double octave
-            ]
-            # Piano envelope: quick attack, long decay
-            envelope = self._adsr_envelope(t, attack=0.01, decay=0.3, sustain=0.2, release=0.2)
-        
-        elif instrument == "bell":
-            # Bell: inharmonic partials, long sustain, very different sound
-            harmonics = [
-                (0.9, 0.5),      # Slightly lower fundamental
-                (1.2, 0.7),      # Inharmonic partial
-                (2.1, 0.6),      # Different harmonic
-                (3.5, 0.4),      # More inharmonic
-            ]
-            envelope = self._adsr_envelope(t, attack=0.15, decay=0.1, sustain=0.8, release=0.3)
-        
-        elif instrument == "violin":
-            # Violin: bright, sustained, many harmonics
-            harmonics = [
-                (1.0, 1.0),
-                (2.0, 0.9),      # Strong 2nd harmonic
-                (3.0, 0.7),      # Strong 3rd
-                (4.0, 0.5),
-                (5.0, 0.3),
-                (6.0, 0.2),
-            ]
-            envelope = self._adsr_envelope(t, attack=0.03, decay=0.05, sustain=0.9, release=0.1)
-        
-        elif instrument == "flute":
-            # Flute: mellow, mostly fundamental, soft attack
-            harmonics = [
-                (1.0, 1.0),
-                (2.0, 0.2),
-                (3.0, 0.05),
-            ]
-            envelope = self._adsr_envelope(t, attack=0.15, decay=0.02, sustain=0.85, release=0.08)
+        ratios, amplitudes, adsr = _INSTRUMENTS.get(instrument, _DEFAULT_INSTRUMENT)
         
+        # Use the fused compiled kernel when numba is available
+        if _synth_kernel is not None:
+            return _synth_kernel(frequency, ratios, amplitudes, num_samples, self.sample_rate,
+                                 _INSTRUMENT_GAINS.get(instrument, _DEFAULT_GAIN),
+                                 *(_FLAT_ADSR if adsr is None else adsr))
+        
+        t = self._time_axis(num_samples)
+        
+        # Combine harmonics: one (harmonics x samples) phase grid, summed over harmonics
+        if numexpr is not None:
+            # numexpr evaluates the grid in cache-sized blocks without materialising it
+            waveform = numexpr.evaluate(
+                "sum(sin(omega * r * t) * a, axis=0)",
+                local_dict={"omega": np.float32(2 * np.pi * frequency), "r": ratios[:, None],
+                            "t": t[None, :], "a": amplitudes[:, None]})
         else:
-            # Default: simple sine
-            harmonics = [(1.0, 1.0)]
-            envelope = np.ones(num_samples)
+            with self._scratch_lock:
+                phases = self._scratch_view(len(ratios) * num_samples).reshape(len(ratios), num_samples)
+                np.multiply.outer(ratios, t, out=phases)
+                phases *= 2 * np.pi * frequency
+                np.sin(phases, out=phases)
+                phases *= amplitudes[:, None]
+                waveform = phases.sum(axis=0)
+        
+        # Apply the envelope, already scaled by the normalizing gain
+        waveform *= self._tone_envelope(num_samples, instrument)
+        
+        return waveform
+    
+    def cached_tone(self, frequency: float, duration: float | None = None,
+                    instrument: str = "piano") -> np.ndarray:
+        """Return the (read-only, shared) rich tone at frequency, synthesising it on a miss.
+        
+        Mixes keep reusing the same few pitches, so recently used tones are kept (LRU)
+        and mixing them in needs no synthesis.
+        
+        Args:
+            frequency: Fundamental frequency in Hz
+            duration: Duration in seconds
+            instrument: Instrument type - "piano", "bell", "violin", "flute"
+        
+        Returns:
+            Numpy array of audio samples, not to be modified
+        """
+        key = (round(frequency, 4), self.duration if duration is None else duration, instrument)
+        with self._cache_lock:
+            tone = self._tone_cache.pop(key, None)
+        if tone is None:
+            tone = self.generate_rich_tone(frequency, duration, instrument)
+            tone.flags.writeable = False
+        with self._cache_lock:
+            if key not in self._tone_cache and len(self._tone_cache) >= _TONE_CACHE_SIZE:
+                del self._tone_cache[next(iter(self._tone_cache))]  # Evict the least recently used
+            self._tone_cache[key] = tone
+        return tone
+    
+    def _synth_batch(self, frequencies: Sequence[float] | np.ndarray,
+                     duration: float | None = None,
+                     instrument: str = "piano") -> np.ndarray:
+        """Mix several tones of one instrument, synthesising all their partials at once.
+        
+        Every voice gets the same normalisation as in generate_rich_tone, so the shared
+        envelope and gain are applied once to the mix.
+        
+        Args:
+            frequencies: Fundamental frequencies in Hz
+            duration: Duration in seconds
+            instrument: Instrument type - "piano", "bell", "violin", "flute"
+        
+        Returns:
+            Numpy array of mixed audio samples
+        """
+        if duration is None:
+            duration = self.duration
+        
+        num_samples = int(self.sample_rate * duration)
+        ratios, amplitudes, _ = _INSTRUMENTS.get(instrument, _DEFAULT_INSTRUMENT)
+        
+        # The compiled kernel is already fused per tone, so just mix its output
+        if _synth_kernel is not None:
+            waveform = np.zeros(num_samples, dtype=np.float32)
+            for freq in frequencies:
+                waveform += self.cached_tone(freq, duration, instrument)
+            return waveform
+        
+        t = self._time_axis(num_samples)
+        
+        # Every partial of every voice in one (voices * harmonics x samples) phase grid
+        num_voices = len(frequencies)
+        num_partials = num_voices * len(ratios)
+        angular = np.repeat(2 * np.pi * np.asarray(frequencies, dtype=np.float64), len(ratios))
+        with self._scratch_lock:
+            phases = self._scratch_view(num_partials * num_samples).reshape(num_partials, num_samples)
+            np.multiply.outer(np.tile(ratios, num_voices), t, out=phases)
+            phases *= angular.astype(np.float32)[:, None]
+            np.sin(phases, out=phases)
+            phases *= np.tile(amplitudes, num_voices)[:, None]
+            waveform = phases.sum(axis=0)
+        
+        # Apply the envelope, already scaled by the normalizing gain
+        waveform *= self._tone_envelope(num_samples, instrument)
+        
+        return waveform
+    
+    def _synth_sequence(self, frequencies: Sequence[float] | np.ndarray,
+                        duration: float | None = None,
+                        instrument: str = "piano") -> np.ndarray:
+        """Synthesise tones back to back into one buffer, so they play as a single Sound.
         
-        # Combine harmonics
-        for harmonic_ratio, amplitude in harmonics:
-            freq = frequency * harmonic_ratio
-            harmonic = np.sin(2 * np.pi * freq * t) * amplitude
-            waveform += harmonic
+        Args:
+            frequencies: Fundamental frequencies in Hz, in playing order
+            duration: Duration of each tone in seconds
+            instrument: Instrument type - "piano", "bell", "violin", "flute"
         
-        # Normalize to prevent clipping
-        max_val = np.max(np.abs(waveform))
-        if max_val > 0:
-            waveform = waveform / max_val
+        Returns:
+            Numpy array of concatenated audio samples
+        """
+        if duration is None:
+            duration = self.duration
+        
+        num_samples = int(self.sample_rate * duration)
+        notes = np.empty((len(frequencies), num_samples), dtype=np.float32)
+        for note, freq in zip(notes, frequencies):
+            note[:] = self.cached_tone(freq, duration, instrument)
+        return notes.ravel()
+    
+    def _synth_timeline(self, notes: Sequence[tuple[float, float, float]],
+                        instrument: str = "piano") -> np.ndarray:
+        """Mix tones into one buffer, each starting at its own offset.
         
-        # Apply envelope and scale (reduced to 0.6 for less aggressive synthesis)
-        waveform = waveform * envelope * 0.6
+        Args:
+            notes: (frequency in Hz, duration in seconds, start offset in seconds) per tone
+            instrument: Instrument type - "piano", "bell", "violin", "flute"
         
+        Returns:
+            Numpy array of mixed audio samples
+        """
+        onsets = [int(round(self.sample_rate * start)) for _, _, start in notes]
+        lengths = [int(self.sample_rate * duration) for _, duration, _ in notes]
+        waveform = np.zeros(max((onset + length for onset, length in zip(onsets, lengths)), default=0),
+                            dtype=np.float32)
+        for (freq, duration, _), onset, length in zip(notes, onsets, lengths):
+            waveform[onset:onset + length] += self.cached_tone(freq, duration, instrument)
         return waveform
     
+    def _time_axis(self, num_samples: int) -> np.ndarray:
+        """Return the (read-only, shared) sample times in seconds for a tone of num_samples.
+        
+        Args:
+            num_samples: Number of samples
+        
+        Returns:
+            float32 array of sample times
+        """
+        t = self._t_cache.get(num_samples)
+        if t is None:
+            t = np.arange(num_samples, dtype=np.float32) / np.float32(self.sample_rate)
+            t.flags.writeable = False
+            with self._cache_lock:
+                if len(self._t_cache) >= _TIME_AXIS_CACHE_SIZE:
+                    del self._t_cache[next(iter(self._t_cache))]  # Evict the oldest entry
+                self._t_cache[num_samples] = t
+        return t
+    
+    def _tone_envelope(self, num_samples: int, instrument: str) -> np.ndarray:
+        """Return the (read-only, shared) envelope of an instrument, scaled by its gain.
+        
+        The envelope does not depend on frequency, so it is built once per tone length
+        and reused for every note of that instrument.
+        
+        Args:
+            num_samples: Number of samples
+            instrument: Instrument type - "piano", "bell", "violin", "flute"
+        
+        Returns:
+            float32 array to multiply the raw harmonic sum by
+        """
+        key = (num_samples, instrument if instrument in _INSTRUMENTS else None)
+        envelope = self._envelope_cache.get(key)
+        if envelope is None:
+            _, _, adsr = _INSTRUMENTS.get(instrument, _DEFAULT_INSTRUMENT)
+            gain = _INSTRUMENT_GAINS.get(instrument, _DEFAULT_GAIN)
+            if adsr is None:
+                envelope = np.full(num_samples, gain, dtype=np.float32)
+            else:
+                envelope = self._adsr_envelope(self._time_axis(num_samples), *adsr)
+                envelope *= gain
+            envelope.flags.writeable = False
+            with self._cache_lock:
+                if len(self._envelope_cache) >= _ENVELOPE_CACHE_SIZE:
+                    del self._envelope_cache[next(iter(self._envelope_cache))]  # Evict the oldest entry
+                self._envelope_cache[key] = envelope
+        return envelope
+    
+    def _scratch_view(self, size: int) -> np.ndarray:
+        """Return the first size elements of the float32 scratch buffer, growing it if needed.
+        
+        Callers must hold _scratch_lock while they use the view.
+        """
+        if len(self._scratch) < size:
+            self._scratch = np.empty(size, dtype=np.float32)
+        return self._scratch[:size]
+    
     def _adsr_envelope(self, t: np.ndarray, attack: float, decay: float, 
                       sustain: float, release: float) -> np.ndarray:
         """Generate ADSR (Attack, Decay, Sustain, Release) envelope.
@@ -143,30 +418,29 @@ class AudioPlayer:
         envelope = np.ones_like(t)
         total_duration = t[-1]
         
+        # t is sorted, so each phase is a contiguous slice; find its first sample past each boundary
+        decay_start = attack
+        decay_end = attack + decay
+        release_start = total_duration - release
+        attack_stop, decay_stop, release_idx = np.searchsorted(
+            t, np.array([decay_start, decay_end, release_start], dtype=t.dtype), side="right")
+        
         # Attack phase
-        attack_mask = t <= attack
         if attack > 0:
-            envelope[attack_mask] = t[attack_mask] / attack
+            envelope[:attack_stop] = t[:attack_stop] / attack
         
         # Decay phase
-        decay_start = attack
-        decay_end = attack + decay
-        decay_mask = (t > decay_start) & (t <= decay_end)
         if decay > 0:
-            decay_t = t[decay_mask] - decay_start
-            envelope[decay_mask] = 1.0 - (1.0 - sustain) * (decay_t / decay)
+            decay_t = t[attack_stop:decay_stop] - decay_start
+            envelope[attack_stop:decay_stop] = 1.0 - (1.0 - sustain) * (decay_t / decay)
         
         # Sustain phase
-        sustain_start = decay_end
-        release_start = total_duration - release
-        sustain_mask = (t > sustain_start) & (t <= release_start)
-        envelope[sustain_mask] = sustain
+        envelope[decay_stop:release_idx] = sustain
         
         # Release phase
-        release_mask = t > release_start
         if release > 0:
-            release_t = t[release_mask] - release_start
-            envelope[release_mask] = sustain * np.maximum(0, 1.0 - (release_t / release))
+            release_t = t[release_idx:] - release_start
+            envelope[release_idx:] = sustain * np.maximum(0, 1.0 - (release_t / release))
         
         return envelope
     
@@ -179,50 +453,146 @@ class AudioPlayer:
             duration: Duration in seconds
             instrument: Instrument type - "piano", "bell", "violin", "flute"
         """
-        waveform = self.generate_rich_tone(frequency, duration, instrument)
-        self._play_audio(waveform)
+        if pygame is None:
+            return
+        
+        key = (round(frequency, 4), self.duration if duration is None else duration, instrument)
+        self._get_sound(key, lambda: self.generate_rich_tone(frequency, duration, instrument)).play()
     
-    def play_frequencies(self, frequencies: List[float], 
+    def play_frequencies(self, frequencies: Sequence[float] | np.ndarray, 
                         duration: float | None = None,
                         simultaneous: bool = True,
                         instrument: str = "piano") -> None:
         """Play multiple frequencies.
         
         Args:
-            frequencies: List of frequencies in Hz
+            frequencies: Frequencies in Hz (list or array)
             duration: Duration in seconds
             simultaneous: If True, play frequencies simultaneously (chord).
                         If False, play sequentially.
             instrument: Instrument type
         """
         if simultaneous:
-            waveform = np.zeros(int(self.sample_rate * (duration or self.duration)))
-            for freq in frequencies:
-                waveform += self.generate_rich_tone(freq, duration, instrument)
-            self._play_audio(waveform)
+            if pygame is None:
+                return
+            self._chord_sound(frequencies, duration, instrument).play()
         else:
-            for freq in frequencies:
-                self.play_tone(freq, duration, instrument)
+            if pygame is None:
+                return
+            key = ("sequence", tuple(round(freq, 4) for freq in frequencies),
+                   self.duration if duration is None else duration, instrument)
+            self._get_sound(key, lambda: self._synth_sequence(frequencies, duration, instrument)).play()
     
-    def _play_audio(self, waveform: np.ndarray) -> None:
-        """Internal method to play audio from numpy array.
+    def prepare_tones(self, frequencies: Sequence[float] | np.ndarray,
+                      duration: float | None = None,
+                      instrument: str = "piano") -> None:
+        """Render single tones ahead of time so that play_tone only replays ready sounds.
         
         Args:
-            waveform: Numpy array of audio samples
+            frequencies: Frequencies in Hz (list or array), each rendered as its own tone
+            duration: Duration in seconds
+            instrument: Instrument type
+        """
+        if pygame is None:
+            return
+        for frequency in frequencies:
+            key = (round(frequency, 4), self.duration if duration is None else duration, instrument)
+            self._get_sound(key, lambda: self.generate_rich_tone(frequency, duration, instrument))
+    
+    def play_sequence(self, notes: Sequence[tuple[float, float, float]],
+                      instrument: str = "piano") -> None:
+        """Play tones at fixed onsets, rendered into a single Sound.
+        
+        Timing comes from the sample buffer rather than from timers, so gaps between
+        tones do not jitter with the event loop.
+        
+        Args:
+            notes: (frequency in Hz, duration in seconds, start offset in seconds) per tone
+            instrument: Instrument type
+        """
+        if pygame is None:
+            return
+        
+        key = ("timeline", tuple((round(freq, 4), duration, start) for freq, duration, start in notes), instrument)
+        self._get_sound(key, lambda: self._synth_timeline(notes, instrument)).play()
+    
+    def play_waveform(self, key: tuple, render: Callable[[], np.ndarray]) -> None:
+        """Play a caller-rendered waveform, cached under key so that replays skip rendering.
+        
+        Args:
+            key: Hashable description of everything the waveform depends on
+            render: Callable returning the waveform on a cache miss
+        """
+        if pygame is None:
+            return
+        self._get_sound(key, render).play()
+    
+    def prepare_waveform(self, key: tuple, render: Callable[[], np.ndarray]) -> None:
+        """Render a caller-described waveform ahead of time for a later play_waveform.
+        
+        Args:
+            key: Hashable description of everything the waveform depends on
+            render: Callable returning the waveform on a cache miss
         """
-        # Skip if pygame is not available (e.g., on web servers)
         if pygame is None:
             return
+        self._get_sound(key, render)
+    
+    def _chord_sound(self, frequencies: Sequence[float] | np.ndarray,
+                     duration: float | None, instrument: str) -> "pygame.mixer.Sound":
+        """Return the cached Sound of simultaneous frequencies, synthesising it on a miss."""
+        key = (tuple(sorted(round(freq, 4) for freq in frequencies)),
+               self.duration if duration is None else duration, instrument)
+        return self._get_sound(key, lambda: self._synth_batch(frequencies, duration, instrument))
+    
+    def _get_sound(self, key: tuple, build: Callable[[], np.ndarray]) -> "pygame.mixer.Sound":
+        """Return the cached Sound for key, synthesising it with build on a miss.
+        
+        Ear training replays a small set of pitches and chords, so recently played
+        ones are kept as ready Sounds (LRU) and replay without any synthesis.
+        
+        Args:
+            key: Hashable description of the sound (frequencies, duration, instrument)
+            build: Callable returning the waveform to encode on a cache miss
         
-        # Convert to 16-bit PCM and normalize
-        waveform = np.clip(waveform, -1.0, 1.0)
-        waveform = np.int16(waveform * 32767)
+        Returns:
+            16-bit pygame Sound
+        """
+        with self._cache_lock:
+            sound = self._sound_cache.pop(key, None)
+        if sound is None:
+            # Synthesise outside the lock; a concurrent miss on the same key only renders it twice
+            sound = self._make_sound(build())
+        with self._cache_lock:
+            if key not in self._sound_cache and len(self._sound_cache) >= _SOUND_CACHE_SIZE:
+                del self._sound_cache[next(iter(self._sound_cache))]  # Evict the least recently used
+            self._sound_cache[key] = sound
+        return sound
+    
+    def _make_sound(self, waveform: np.ndarray) -> "pygame.mixer.Sound":
+        """Convert a numpy array of audio samples to a playable pygame Sound.
         
-        # Create stereo by duplicating mono channel
-        stereo = np.zeros((len(waveform), 2), dtype=np.int16)
-        stereo[:, 0] = waveform
-        stereo[:, 1] = waveform
+        Args:
+            waveform: Numpy array of audio samples
+        
+        Returns:
+            16-bit pygame Sound in the mixer's channel layout
+        """
+        # The mixer may already have been opened elsewhere with more channels
+        mixer_format = pygame.mixer.get_init()
+        channels = mixer_format[2] if mixer_format else 1
         
-        sound = pygame.sndarray.make_sound(stereo)
-        sound.play()
+        with self._scratch_lock:
+            # Scale to 16-bit range in one clipped scratch copy (the caller's waveform is left untouched)
+            pcm = np.clip(waveform, -1.0, 1.0, out=self._scratch_view(len(waveform)))
+            pcm *= 32767
+            
+            # Broadcast the mono samples into every mixer channel, casting to int16 on write
+            if len(self._pcm_scratch) < len(pcm) * channels:
+                self._pcm_scratch = np.empty(len(pcm) * channels, dtype=np.int16)
+            frames = self._pcm_scratch[:len(pcm) * channels].reshape(len(pcm), channels)
+            frames[:] = pcm[:, None]
+            
+            # Sound copies the samples, so the scratch buffers can be reused right away
+            return pygame.mixer.Sound(buffer=frames)
 
@@ -6,12 +6,159 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QGridLayout, QMessageBox, QComboBox, QSlider, QCheckBox
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QMutex, QMutexLocker, QRunnable, QThreadPool, QTimer, pyqtSlot
 from PyQt5.QtGui import QFont
 import pygame
 
 from ear_training.modules import IntervalTrainer, Interval, ChordTrainer, ChordType, NoteTrainer, Note, ProgressionTrainer, ChordNumber
-from ear_training.ui.audio_player import AudioPlayer
+from ear_training.ui.audio_player import AudioPlayer, init_audio
+
+# Shared fonts (QFont is implicitly shared, so widgets can all use the same instances)
+_FONT_SMALL = QFont("Arial", 10)
+_FONT_CONTROL = QFont("Arial", 11)
+_FONT_CONTROL_BOLD = QFont("Arial", 11, QFont.Bold)
+_FONT_BODY = QFont("Arial", 12)
+_FONT_SCORE = QFont("Arial", 14)
+_FONT_TITLE = QFont("Arial", 18, QFont.Bold)
+_FONT_MENU_TITLE = QFont("Arial", 24, QFont.Bold)
+_FONT_NOTES = QFont("Courier New", 12, QFont.Bold)
+
+# Note names with octave for every MIDI note number (A4 = 69)
+_NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_NOTE_NAME_BY_MIDI = tuple(f"{_NOTE_NAMES[midi % 12]}{midi // 12 - 1}" for midi in range(128))
+
+# Enum members and combo box mappings, built once instead of on every UI event
+_ALL_INTERVALS = tuple(Interval)
+_ALL_NOTES = tuple(Note)
+_MAX_SEMITONES_BY_INDEX = {
+    0: 3,   # Minor 3rd
+    1: 4,   # Major 3rd
+    2: 5,   # Perfect 4th
+    3: 7,   # Perfect 5th
+    4: 8,   # Minor 6th
+    5: 9,   # Major 6th
+    6: 12,  # Octave
+    7: 36   # All Intervals (up to 3 octaves)
+}
+_INTERVALS_BY_MAX_SEMITONES = {
+    max_semitones: tuple(iv for iv in _ALL_INTERVALS if iv.value <= max_semitones)
+    for max_semitones in _MAX_SEMITONES_BY_INDEX.values()
+}
+_NUM_CHORDS_BY_TEXT = {"2": 2, "3": 3, "4": 4, "5": 5, "Random": None}
+
+# Piano keyboard of the note window: white keys in order, and each black key's
+# position in white-key widths from the start of its octave
+_WHITE_KEY_NOTES = (Note.C, Note.D, Note.E, Note.F, Note.G, Note.A, Note.B)
+_BLACK_KEY_POSITIONS = {
+    Note.C_SHARP: 0.7,
+    Note.D_SHARP: 1.7,
+    Note.F_SHARP: 3.7,
+    Note.G_SHARP: 4.7,
+    Note.A_SHARP: 5.7,
+}
+_WHITE_KEY_WIDTH = 70
+_WHITE_KEY_HEIGHT = 150
+_BLACK_KEY_WIDTH = 45
+_BLACK_KEY_HEIGHT = 100
+_MAX_KEYBOARD_OCTAVES = 3
+
+# Chord qualities written in lowercase (e.g. "ii", "vii"), and each chord's name as shown in progressions
+_LOWERCASE_CHORD_TYPES = frozenset({"minor", "diminished"})
+_CHORD_DISPLAY_NAMES = {
+    chord: chord.name.lower() if chord.value[1] in _LOWERCASE_CHORD_TYPES else chord.name
+    for chord in ChordNumber
+}
+
+# Pitch class of each chord's root relative to C (its semitone offset, stored first in the chord value)
+_CHORD_ROOT_CLASSES = {chord: chord.value[0] % 12 for chord in ChordNumber}
+
+# C4, the tonic the progression window plays and measures chord roots against
+_TONIC_HZ = 262.0
+
+# Mixed chord waveforms kept per progression window for root-boosted replays
+_CHORD_WAVE_CACHE_SIZE = 32
+
+# Static widget styles, installed once on the QApplication and matched by object name or property
+_APP_STYLE_SHEET = """
+    QLabel[result="correct"] { color: green; font-weight: bold; }
+    QLabel[result="wrong"] { color: red; font-weight: bold; }
+    QLabel#progressionLabel { background-color: #f0f0f0; padding: 10px; }
+    QLabel#notesDisplay {
+        background-color: #f9f9f9;
+        padding: 15px;
+        border: 1px solid #ddd;
+        color: #0066cc;
+    }
+    QPushButton#whiteKey {
+        background-color: white;
+        border: 2px solid #333;
+        border-radius: 0px 0px 5px 5px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton#whiteKey:hover {
+        background-color: #e0e0e0;
+    }
+    QPushButton#whiteKey:disabled {
+        background-color: #cccccc;
+    }
+    QPushButton#blackKey {
+        background-color: #1a1a1a;
+        color: white;
+        border: 2px solid #000;
+        border-radius: 0px 0px 3px 3px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton#blackKey:hover {
+        background-color: #333333;
+    }
+    QPushButton#blackKey:disabled {
+        background-color: #555555;
+    }
+"""
+
+
+def _frequencies_to_note_names(frequencies) -> list[str]:
+    """Name the equal-tempered notes nearest to frequencies (e.g. 261.63 -> "C4")."""
+    midi_notes = 69 + np.rint(12 * np.log2(np.asarray(frequencies, dtype=np.float64) / 440.0)).astype(np.intp)
+    return [_NOTE_NAME_BY_MIDI[midi] for midi in midi_notes.tolist()]
+
+
+def _chord_matrix(chords) -> np.ndarray:
+    """Pack chords of differing sizes into the rows of one NaN-padded frequency matrix."""
+    matrix = np.full((len(chords), max(map(len, chords), default=0)), np.nan)
+    for row, frequencies in zip(matrix, chords):
+        row[:len(frequencies)] = frequencies
+    return matrix
+
+
+def _set_result_state(label: QLabel, state: str) -> None:
+    """Colour a result label as "correct" or "wrong" by re-polishing it against the app stylesheet."""
+    label.setProperty("result", state)
+    label.style().unpolish(label)
+    label.style().polish(label)
+
+
+class _AudioTask(QRunnable):
+    """Runs one audio call on a thread pool worker."""
+    
+    def __init__(self, play, *args, **kwargs):
+        super().__init__()
+        self._play = play
+        self._args = args
+        self._kwargs = kwargs
+    
+    def run(self):
+        self._play(*self._args, **self._kwargs)
+
+
+def _play_in_background(play, *args, **kwargs) -> None:
+    """Synthesise and play off the GUI thread, so rendering never stalls repaints.
+    
+    Arguments are evaluated by the caller, so they are a snapshot of the trainer state.
+    """
+    QThreadPool.globalInstance().start(_AudioTask(play, *args, **kwargs))
 
 
 class IntervalTrainingWindow(QMainWindow):
@@ -28,7 +175,7 @@ class IntervalTrainingWindow(QMainWindow):
         self.instrument_combo = None
         self.max_interval_combo = None
         self.max_interval_semitones = 12  # Default to Octave
-        self.available_intervals = list(Interval)
+        self.available_intervals = _ALL_INTERVALS
         
         self.init_ui()
     
@@ -44,20 +191,20 @@ class IntervalTrainingWindow(QMainWindow):
         
         # Title
         title = QLabel("Interval Recognition Training")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
         
         # Score
         self.score_label = QLabel(f"Score: {self.score}/{self.total}")
-        self.score_label.setFont(QFont("Arial", 14))
+        self.score_label.setFont(_FONT_SCORE)
         layout.addWidget(self.score_label)
         
         # Instrument selection
         instrument_layout = QHBoxLayout()
         instrument_label = QLabel("Instrument:")
-        instrument_label.setFont(QFont("Arial", 12))
+        instrument_label.setFont(_FONT_BODY)
         self.instrument_combo = QComboBox()
-        self.instrument_combo.setFont(QFont("Arial", 11))
+        self.instrument_combo.setFont(_FONT_CONTROL)
         self.instrument_combo.addItems(["Piano", "Bell", "Violin", "Flute"])
         self.instrument_combo.activated.connect(self.on_instrument_changed)
         self.selected_instrument = "piano"  # Initialize default
@@ -67,9 +214,9 @@ class IntervalTrainingWindow(QMainWindow):
         
         # Max interval selection
         max_interval_label = QLabel("Max Interval:")
-        max_interval_label.setFont(QFont("Arial", 12))
+        max_interval_label.setFont(_FONT_BODY)
         self.max_interval_combo = QComboBox()
-        self.max_interval_combo.setFont(QFont("Arial", 11))
+        self.max_interval_combo.setFont(_FONT_CONTROL)
         self.max_interval_combo.addItems([
             "Minor 3rd",
             "Major 3rd",
@@ -89,66 +236,76 @@ class IntervalTrainingWindow(QMainWindow):
         
         # Instructions
         instructions = QLabel("Listen to the interval, then click the correct answer")
-        instructions.setFont(QFont("Arial", 12))
+        instructions.setFont(_FONT_BODY)
         layout.addWidget(instructions)
         
         # Play button
         self.play_button = QPushButton("▶ Play Interval")
-        self.play_button.setFont(QFont("Arial", 12))
-        self.play_button.clicked.connect(lambda: self.on_play_clicked())
+        self.play_button.setFont(_FONT_BODY)
+        self.play_button.clicked.connect(self.on_play_clicked)
         layout.addWidget(self.play_button)
         
         # Result label
         self.result_label = QLabel("")
-        self.result_label.setFont(QFont("Arial", 12))
+        self.result_label.setFont(_FONT_BODY)
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
         
-        # Interval buttons grid (will be populated dynamically)
+        # Interval buttons grid: a button for every interval, shown only when it is available
         self.interval_grid = QGridLayout()
         self.interval_buttons = {}
-        
-        # Initialize available intervals based on default max interval setting
-        all_intervals = list(Interval)
-        self.available_intervals = [iv for iv in all_intervals if iv.value <= self.max_interval_semitones]
-        
-        self.rebuild_interval_buttons()
+        self._interval_by_button = {}
+        for i, interval in enumerate(Interval):
+            row = i // 4
+            col = i % 4
+            btn = QPushButton(interval.name.replace("_", " ").title())
+            btn.setFont(_FONT_SMALL)
+            btn.setMinimumHeight(50)
+            btn.clicked.connect(self._on_interval_button_clicked)
+            self.interval_grid.addWidget(btn, row, col)
+            self.interval_buttons[interval] = btn
+            self._interval_by_button[btn] = interval
         layout.addLayout(self.interval_grid)
         
         # Exit button
         exit_button = QPushButton("Exit")
-        exit_button.setFont(QFont("Arial", 12))
+        exit_button.setFont(_FONT_BODY)
         exit_button.clicked.connect(self.exit_training)
         layout.addWidget(exit_button)
         
-        # Generate first interval
-        self.new_interval()
+        # One reusable timer moves on to the next question after each answer
+        self._advance_timer = QTimer(self)
+        self._advance_timer.setSingleShot(True)
+        self._advance_timer.setInterval(2000)
+        self._advance_timer.timeout.connect(self.new_interval)
         
-        # Manually trigger on_max_interval_changed to properly initialize
+        # Apply the default max interval and generate the first interval
         # (activated signal won't fire during setCurrentIndex)
         self.on_max_interval_changed()
     
+    @pyqtSlot()
     def new_interval(self):
         """Generate a new interval."""
         self.current_interval = self.trainer.generate_interval(interval_range=(0, self.max_interval_semitones))
         self.result_label.setText("")
         self.disable_interval_buttons(False)
     
+    @pyqtSlot()
     def on_play_clicked(self):
         """Handle play button click."""
         self.play_interval()
 
     def play_interval(self):
         """Play the current interval."""
-        if self.current_interval:
+        if self.current_interval is not None:
             freq1, freq2 = self.trainer.get_frequencies()
             # Play in ascending or descending order based on current direction
             if self.trainer.current_direction == "descending":
                 freq1, freq2 = freq2, freq1  # Swap for descending
             
-            self.player.play_tone(freq1, duration=0.5, instrument=self.selected_instrument)
-            # Use QTimer instead of time.sleep to avoid blocking GUI
-            QTimer.singleShot(600, lambda: self.player.play_tone(freq2, duration=0.5, instrument=self.selected_instrument))
+            # Both tones go out as one buffer with the second starting 0.6s in, so the gap is exact
+            _play_in_background(self.player.play_sequence, [(freq1, 0.5, 0.0), (freq2, 0.5, 0.6)],
+                                instrument=self.selected_instrument)
     
     def guess_interval(self, interval: Interval):
         """Handle interval guess."""
@@ -158,82 +315,59 @@ class IntervalTrainingWindow(QMainWindow):
         if is_correct:
             self.score += 1
             self.result_label.setText(f"✓ Correct! It was {self.current_interval.name}")
-            self.result_label.setStyleSheet("color: green; font-weight: bold;")
+            _set_result_state(self.result_label, "correct")
         else:
             self.result_label.setText(
                 f"✗ Wrong. Correct answer: {self.current_interval.name}, "
                 f"You said: {interval.name}"
             )
-            self.result_label.setStyleSheet("color: red; font-weight: bold;")
+            _set_result_state(self.result_label, "wrong")
         
         self.score_label.setText(f"Score: {self.score}/{self.total}")
         self.disable_interval_buttons(True)
         
         # Generate and schedule the next interval
-        QTimer.singleShot(2000, self.new_interval)
+        self._advance_timer.start()
     
     def disable_interval_buttons(self, disabled: bool):
         """Disable/enable interval buttons."""
         for btn in self.interval_buttons.values():
             btn.setEnabled(not disabled)
     
-    def rebuild_interval_buttons(self):
-        """Rebuild interval buttons based on available intervals."""
-        # Clear existing buttons
-        for btn in self.interval_buttons.values():
-            btn.deleteLater()
-        self.interval_buttons.clear()
-        
-        # Clear grid layout
-        while self.interval_grid.count():
-            item = self.interval_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Create buttons for available intervals
-        for i, interval in enumerate(self.available_intervals):
-            row = i // 4
-            col = i % 4
-            btn = QPushButton(interval.name.replace("_", " ").title())
-            btn.setFont(QFont("Arial", 10))
-            btn.setMinimumHeight(50)
-            btn.clicked.connect(lambda checked, iv=interval: self.guess_interval(iv))
-            self.interval_grid.addWidget(btn, row, col)
-            self.interval_buttons[interval] = btn
+    def update_interval_buttons(self):
+        """Show the buttons of available intervals and hide the rest."""
+        # Intervals are ordered by size, so the available ones fill the grid from the top without gaps
+        available = set(self.available_intervals)
+        for interval, btn in self.interval_buttons.items():
+            btn.setVisible(interval in available)
+    
+    @pyqtSlot()
+    def _on_interval_button_clicked(self):
+        """Guess the interval of whichever interval button was clicked."""
+        self.guess_interval(self._interval_by_button[self.sender()])
     
+    @pyqtSlot()
     def on_max_interval_changed(self):
         """Handle max interval selection change."""
         index = self.max_interval_combo.currentIndex()
+        self.max_interval_semitones = _MAX_SEMITONES_BY_INDEX[index]
         
-        # Map selection to semitones
-        max_semitones_map = {
-            0: 3,   # Minor 3rd
-            1: 4,   # Major 3rd
-            2: 5,   # Perfect 4th
-            3: 7,   # Perfect 5th
-            4: 8,   # Minor 6th
-            5: 9,   # Major 6th
-            6: 12,  # Octave
-            7: 36   # All Intervals (up to 3 octaves)
-        }
-        
-        self.max_interval_semitones = max_semitones_map[index]
-        
-        # Update available intervals
-        all_intervals = list(Interval)
-        self.available_intervals = [iv for iv in all_intervals if iv.value <= self.max_interval_semitones]
-        
-        # Rebuild buttons
-        self.rebuild_interval_buttons()
+        # Show buttons for the available intervals (the tuples are shared, so identity tells a change)
+        available = _INTERVALS_BY_MAX_SEMITONES[self.max_interval_semitones]
+        if available is not self.available_intervals:
+            self.available_intervals = available
+            self.update_interval_buttons()
         
         # Generate new interval
         self.new_interval()
     
+    @pyqtSlot()
     def on_instrument_changed(self):
         """Handle instrument selection change."""
         text = self.instrument_combo.currentText()
         self.selected_instrument = text.lower()
     
+    @pyqtSlot()
     def exit_training(self):
         """Exit training and show final score."""
         if self.total > 0:
@@ -244,12 +378,6 @@ class IntervalTrainingWindow(QMainWindow):
                 f"Final Score: {self.score}/{self.total} ({percentage:.1f}%)"
             )
         self.close()
-    
-    def closeEvent(self, event):
-        """Handle window close event and clean up resources."""
-        # Stop pygame mixer to prevent crashes
-        pygame.mixer.quit()
-        event.accept()
 
 
 class ChordTrainingWindow(QMainWindow):
@@ -265,6 +393,7 @@ class ChordTrainingWindow(QMainWindow):
         self.selected_instrument = "piano"
         self.instrument_combo = None
         self.chord_buttons = {}
+        self._chord_by_button = {}
         
         self.init_ui()
     
@@ -278,18 +407,18 @@ class ChordTrainingWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         
         title = QLabel("Chord Recognition Training")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
         
         self.score_label = QLabel(f"Score: {self.score}/{self.total}")
-        self.score_label.setFont(QFont("Arial", 14))
+        self.score_label.setFont(_FONT_SCORE)
         layout.addWidget(self.score_label)
         
         instrument_layout = QHBoxLayout()
         instrument_label = QLabel("Instrument:")
-        instrument_label.setFont(QFont("Arial", 12))
+        instrument_label.setFont(_FONT_BODY)
         self.instrument_combo = QComboBox()
-        self.instrument_combo.setFont(QFont("Arial", 11))
+        self.instrument_combo.setFont(_FONT_CONTROL)
         self.instrument_combo.addItems(["Piano", "Bell", "Violin", "Flute"])
         self.instrument_combo.activated.connect(self.on_instrument_changed)
         self.selected_instrument = "piano"
@@ -299,16 +428,16 @@ class ChordTrainingWindow(QMainWindow):
         layout.addLayout(instrument_layout)
         
         instructions = QLabel("Listen to the chord, then click the correct chord type")
-        instructions.setFont(QFont("Arial", 12))
+        instructions.setFont(_FONT_BODY)
         layout.addWidget(instructions)
         
         self.play_button = QPushButton("▶ Play Chord")
-        self.play_button.setFont(QFont("Arial", 12))
+        self.play_button.setFont(_FONT_BODY)
         self.play_button.clicked.connect(self.on_play_clicked)
         layout.addWidget(self.play_button)
         
         self.result_label = QLabel("")
-        self.result_label.setFont(QFont("Arial", 12))
+        self.result_label.setFont(_FONT_BODY)
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
         
@@ -318,18 +447,25 @@ class ChordTrainingWindow(QMainWindow):
             row = i // 3
             col = i % 3
             btn = QPushButton(chord.name.replace("_", " "))
-            btn.setFont(QFont("Arial", 11))
+            btn.setFont(_FONT_CONTROL)
             btn.setMinimumHeight(48)
-            btn.clicked.connect(lambda checked, ct=chord: self.guess_chord(ct))
+            btn.clicked.connect(self._on_chord_button_clicked)
             grid.addWidget(btn, row, col)
             self.chord_buttons[chord] = btn
+            self._chord_by_button[btn] = chord
         layout.addLayout(grid)
         
         exit_button = QPushButton("Exit")
-        exit_button.setFont(QFont("Arial", 12))
+        exit_button.setFont(_FONT_BODY)
         exit_button.clicked.connect(self.exit_training)
         layout.addWidget(exit_button)
         
+        # One reusable timer moves on to the next question after each answer
+        self._advance_timer = QTimer(self)
+        self._advance_timer.setSingleShot(True)
+        self._advance_timer.setInterval(2000)
+        self._advance_timer.timeout.connect(self.advance_to_next)
+        
         self.new_chord()
     
     def new_chord(self):
@@ -338,6 +474,7 @@ class ChordTrainingWindow(QMainWindow):
         self.result_label.setText("")
         self.disable_chord_buttons(False)
     
+    @pyqtSlot()
     def on_play_clicked(self):
         """Handle play button click."""
         self.play_chord()
@@ -346,7 +483,12 @@ class ChordTrainingWindow(QMainWindow):
         """Play the current chord."""
         if self.current_chord:
             freqs = self.trainer.get_frequencies()
-            self.player.play_frequencies(freqs, duration=0.9, instrument=self.selected_instrument)
+            _play_in_background(self.player.play_frequencies, freqs, duration=0.9, instrument=self.selected_instrument)
+    
+    @pyqtSlot()
+    def _on_chord_button_clicked(self):
+        """Guess the chord of whichever chord button was clicked."""
+        self.guess_chord(self._chord_by_button[self.sender()])
     
     def guess_chord(self, chord: ChordType):
         """Handle chord guess."""
@@ -356,33 +498,36 @@ class ChordTrainingWindow(QMainWindow):
         if is_correct:
             self.score += 1
             self.result_label.setText(f"✓ Correct! It was {self.current_chord.name}")
-            self.result_label.setStyleSheet("color: green; font-weight: bold;")
+            _set_result_state(self.result_label, "correct")
         else:
             self.result_label.setText(
                 f"✗ Wrong. Correct answer: {self.current_chord.name}, You said: {chord.name}"
             )
-            self.result_label.setStyleSheet("color: red; font-weight: bold;")
+            _set_result_state(self.result_label, "wrong")
         
         self.score_label.setText(f"Score: {self.score}/{self.total}")
         self.disable_chord_buttons(True)
         self.current_chord = self.trainer.generate_chord()
-        QTimer.singleShot(2000, self.advance_to_next)
+        self._advance_timer.start()
     
     def disable_chord_buttons(self, disabled: bool):
         """Disable/enable chord buttons."""
         for btn in self.chord_buttons.values():
             btn.setEnabled(not disabled)
     
+    @pyqtSlot()
     def advance_to_next(self):
         """Prepare UI for next chord."""
         self.result_label.setText("")
         self.disable_chord_buttons(False)
     
+    @pyqtSlot()
     def on_instrument_changed(self):
         """Handle instrument selection change."""
         text = self.instrument_combo.currentText()
         self.selected_instrument = text.lower()
     
+    @pyqtSlot()
     def exit_training(self):
         """Exit training and show final score."""
         if self.total > 0:
@@ -393,11 +538,6 @@ class ChordTrainingWindow(QMainWindow):
                 f"Final Score: {self.score}/{self.total} ({percentage:.1f}%)"
             )
         self.close()
-    
-    def closeEvent(self, event):
-        """Handle window close event and clean up resources."""
-        pygame.mixer.quit()
-        event.accept()
 
 
 class ProgressionTrainingWindow(QMainWindow):
@@ -411,10 +551,16 @@ class ProgressionTrainingWindow(QMainWindow):
         self.total = 0
         self.current_progression = None
         self.current_frequencies = None
+        self._frequency_matrix = None  # current_frequencies as rows of a NaN-padded matrix
+        self._notes_display_text = None  # Rendered voice-leading grid of the current progression
+        self._chord_wave_cache: dict[tuple, np.ndarray] = {}
+        # Pre-render and playback workers fill the chord cache while the GUI thread clears it
+        self._chord_wave_mutex = QMutex()
         self.selected_instrument = "piano"
         self.instrument_combo = None
         self.num_chords_combo = None
         self.chord_buttons = {}
+        self._chord_by_button = {}
         self.user_progression = []
         self.guessing_index = 0
         self.start_on_tonic = True
@@ -433,18 +579,18 @@ class ProgressionTrainingWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         
         title = QLabel("Harmonic Progression Training")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
         
         self.score_label = QLabel(f"Score: {self.score}/{self.total}")
-        self.score_label.setFont(QFont("Arial", 14))
+        self.score_label.setFont(_FONT_SCORE)
         layout.addWidget(self.score_label)
         
         instrument_layout = QHBoxLayout()
         instrument_label = QLabel("Instrument:")
-        instrument_label.setFont(QFont("Arial", 12))
+        instrument_label.setFont(_FONT_BODY)
         self.instrument_combo = QComboBox()
-        self.instrument_combo.setFont(QFont("Arial", 11))
+        self.instrument_combo.setFont(_FONT_CONTROL)
         self.instrument_combo.addItems(["Piano", "Bell", "Violin", "Flute"])
         self.instrument_combo.activated.connect(self.on_instrument_changed)
         self.selected_instrument = "piano"
@@ -453,9 +599,9 @@ class ProgressionTrainingWindow(QMainWindow):
         instrument_layout.addSpacing(20)
         
         num_chords_label = QLabel("Number of Chords:")
-        num_chords_label.setFont(QFont("Arial", 12))
+        num_chords_label.setFont(_FONT_BODY)
         self.num_chords_combo = QComboBox()
-        self.num_chords_combo.setFont(QFont("Arial", 11))
+        self.num_chords_combo.setFont(_FONT_CONTROL)
         self.num_chords_combo.addItems(["2", "3", "4", "5", "Random"])
         self.num_chords_combo.setCurrentIndex(4)  # Default to Random
         self.num_chords_combo.activated.connect(self.on_num_chords_changed)
@@ -468,11 +614,11 @@ class ProgressionTrainingWindow(QMainWindow):
         from PyQt5.QtWidgets import QSlider
         options_layout = QHBoxLayout()
         root_volume_label = QLabel("Root Note Volume:")
-        root_volume_label.setFont(QFont("Arial", 11))
+        root_volume_label.setFont(_FONT_CONTROL)
         options_layout.addWidget(root_volume_label)
         
         self.root_volume_slider = QSlider(Qt.Horizontal)
-        self.root_volume_slider.setFont(QFont("Arial", 10))
+        self.root_volume_slider.setFont(_FONT_SMALL)
         self.root_volume_slider.setMinimum(100)
         self.root_volume_slider.setMaximum(400)
         self.root_volume_slider.setValue(100)
@@ -482,8 +628,14 @@ class ProgressionTrainingWindow(QMainWindow):
         options_layout.addWidget(self.root_volume_slider)
         
         self.root_volume_value_label = QLabel("100%")
-        self.root_volume_value_label.setFont(QFont("Arial", 11, QFont.Bold))
+        self.root_volume_value_label.setFont(_FONT_CONTROL_BOLD)
         self.root_volume_value_label.setMinimumWidth(40)
+        
+        # Coalesce slider drags into one label update per 50 ms burst
+        self._slider_debounce = QTimer(self)
+        self._slider_debounce.setSingleShot(True)
+        self._slider_debounce.setInterval(50)
+        self._slider_debounce.timeout.connect(self._apply_slider_state)
         self.root_volume_slider.valueChanged.connect(self.on_root_volume_changed)
         options_layout.addWidget(self.root_volume_value_label)
         
@@ -491,11 +643,11 @@ class ProgressionTrainingWindow(QMainWindow):
         
         # Playback speed slider
         playback_speed_label = QLabel("Playback Speed:")
-        playback_speed_label.setFont(QFont("Arial", 11))
+        playback_speed_label.setFont(_FONT_CONTROL)
         options_layout.addWidget(playback_speed_label)
         
         self.playback_speed_slider = QSlider(Qt.Horizontal)
-        self.playback_speed_slider.setFont(QFont("Arial", 10))
+        self.playback_speed_slider.setFont(_FONT_SMALL)
         self.playback_speed_slider.setMinimum(50)
         self.playback_speed_slider.setMaximum(200)
         self.playback_speed_slider.setValue(100)
@@ -505,7 +657,7 @@ class ProgressionTrainingWindow(QMainWindow):
         options_layout.addWidget(self.playback_speed_slider)
         
         self.playback_speed_value_label = QLabel("1.0x")
-        self.playback_speed_value_label.setFont(QFont("Arial", 11, QFont.Bold))
+        self.playback_speed_value_label.setFont(_FONT_CONTROL_BOLD)
         self.playback_speed_value_label.setMinimumWidth(40)
         self.playback_speed_slider.valueChanged.connect(self.on_playback_speed_changed)
         options_layout.addWidget(self.playback_speed_value_label)
@@ -514,21 +666,21 @@ class ProgressionTrainingWindow(QMainWindow):
         
         # Start on tonic checkbox
         self.start_on_tonic_checkbox = QCheckBox("Start on Tonic")
-        self.start_on_tonic_checkbox.setFont(QFont("Arial", 11))
+        self.start_on_tonic_checkbox.setFont(_FONT_CONTROL)
         self.start_on_tonic_checkbox.setChecked(True)
         self.start_on_tonic_checkbox.stateChanged.connect(self.on_start_on_tonic_changed)
         options_layout.addWidget(self.start_on_tonic_checkbox)
         
         # Use common progressions only checkbox
         self.use_common_checkbox = QCheckBox("Common Progressions Only")
-        self.use_common_checkbox.setFont(QFont("Arial", 11))
+        self.use_common_checkbox.setFont(_FONT_CONTROL)
         self.use_common_checkbox.setChecked(False)
         self.use_common_checkbox.stateChanged.connect(self.on_use_common_changed)
         options_layout.addWidget(self.use_common_checkbox)
         
         # Play tonic button
         self.play_tonic_button = QPushButton("♪ Play Tonic")
-        self.play_tonic_button.setFont(QFont("Arial", 11))
+        self.play_tonic_button.setFont(_FONT_CONTROL)
         self.play_tonic_button.setMaximumWidth(120)
         self.play_tonic_button.clicked.connect(self.on_play_tonic_clicked)
         options_layout.addWidget(self.play_tonic_button)
@@ -539,30 +691,30 @@ class ProgressionTrainingWindow(QMainWindow):
         instructions = QLabel(
             "Listen to the chord progression, then click the chord numbers in order."
         )
-        instructions.setFont(QFont("Arial", 12))
+        instructions.setFont(_FONT_BODY)
         layout.addWidget(instructions)
         
         # Progression display
         self.progression_label = QLabel("Waiting for progression...")
-        self.progression_label.setFont(QFont("Arial", 12))
-        self.progression_label.setStyleSheet("background-color: #f0f0f0; padding: 10px;")
+        self.progression_label.setFont(_FONT_BODY)
+        self.progression_label.setObjectName("progressionLabel")
         layout.addWidget(self.progression_label)
         
         # Play buttons layout
         play_buttons_layout = QHBoxLayout()
         
         self.play_button = QPushButton("▶ Play Progression")
-        self.play_button.setFont(QFont("Arial", 12))
+        self.play_button.setFont(_FONT_BODY)
         self.play_button.clicked.connect(self.on_play_clicked)
         play_buttons_layout.addWidget(self.play_button)
         
         self.play_arpeggio_button = QPushButton("▶ Play as Arpeggio")
-        self.play_arpeggio_button.setFont(QFont("Arial", 12))
+        self.play_arpeggio_button.setFont(_FONT_BODY)
         self.play_arpeggio_button.clicked.connect(self.on_play_arpeggio_clicked)
         play_buttons_layout.addWidget(self.play_arpeggio_button)
         
         self.repeat_button = QPushButton("↻ Repeat")
-        self.repeat_button.setFont(QFont("Arial", 12))
+        self.repeat_button.setFont(_FONT_BODY)
         self.repeat_button.clicked.connect(self.on_repeat_clicked)
         play_buttons_layout.addWidget(self.repeat_button)
         
@@ -570,20 +722,19 @@ class ProgressionTrainingWindow(QMainWindow):
         
         # Current chord notes display
         self.notes_display_label = QLabel("")
-        notes_font = QFont("Courier New", 12, QFont.Bold)
-        self.notes_display_label.setFont(notes_font)
+        self.notes_display_label.setFont(_FONT_NOTES)
         self.notes_display_label.setAlignment(Qt.AlignCenter)
-        self.notes_display_label.setStyleSheet("background-color: #f9f9f9; padding: 15px; border: 1px solid #ddd; color: #0066cc;")
+        self.notes_display_label.setObjectName("notesDisplay")
         layout.addWidget(self.notes_display_label)
         
         # User's progression display and undo button
         answer_layout = QHBoxLayout()
         self.user_progression_label = QLabel("")
-        self.user_progression_label.setFont(QFont("Arial", 11))
+        self.user_progression_label.setFont(_FONT_CONTROL)
         answer_layout.addWidget(self.user_progression_label)
         
         self.undo_button = QPushButton("↶")
-        self.undo_button.setFont(QFont("Arial", 10))
+        self.undo_button.setFont(_FONT_SMALL)
         self.undo_button.setMaximumWidth(80)
         self.undo_button.clicked.connect(self.on_undo_clicked)
         answer_layout.addWidget(self.undo_button)
@@ -592,7 +743,7 @@ class ProgressionTrainingWindow(QMainWindow):
         
         # Result label
         self.result_label = QLabel("")
-        self.result_label.setFont(QFont("Arial", 12))
+        self.result_label.setFont(_FONT_BODY)
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
         
@@ -623,23 +774,21 @@ class ProgressionTrainingWindow(QMainWindow):
                 chord_label = "III+"
             else:
                 # Use lowercase for minor and diminished chords
-                if chord_type in ["minor", "diminished"]:
-                    chord_label = chord.name.lower()
-                else:
-                    chord_label = chord.name
+                chord_label = _CHORD_DISPLAY_NAMES[chord]
             
             btn_label = f"{chord_label}\n({chord_type})"
             btn = QPushButton(btn_label)
-            btn.setFont(QFont("Arial", 11, QFont.Bold))
+            btn.setFont(_FONT_CONTROL_BOLD)
             btn.setMinimumHeight(70)
             btn.setMinimumWidth(90)
-            btn.clicked.connect(lambda checked, ct=chord: self.guess_chord(ct))
+            btn.clicked.connect(self._on_chord_button_clicked)
             grid.addWidget(btn, row, col)
             self.chord_buttons[chord] = btn
+            self._chord_by_button[btn] = chord
         layout.addLayout(grid)
         
         exit_button = QPushButton("Exit")
-        exit_button.setFont(QFont("Arial", 12))
+        exit_button.setFont(_FONT_BODY)
         exit_button.clicked.connect(self.exit_training)
         layout.addWidget(exit_button)
         
@@ -648,11 +797,7 @@ class ProgressionTrainingWindow(QMainWindow):
     def new_progression(self):
         """Generate a new progression."""
         # Determine number of chords (ignored if using common only)
-        combo_text = self.num_chords_combo.currentText()
-        if combo_text == "Random":
-            num_chords = None
-        else:
-            num_chords = int(combo_text)
+        num_chords = _NUM_CHORDS_BY_TEXT[self.num_chords_combo.currentText()]
         
         self.current_progression = self.trainer.generate_progression(
             num_chords, 
@@ -660,13 +805,23 @@ class ProgressionTrainingWindow(QMainWindow):
             use_common_only=self.use_common_only
         )
         self.current_frequencies = self.trainer.get_progression_frequencies(use_inversions=True)
+        self._frequency_matrix = _chord_matrix(self.current_frequencies)
+        self._notes_display_text = None
+        with QMutexLocker(self._chord_wave_mutex):
+            self._chord_wave_cache.clear()
         self.user_progression = []
         self.guessing_index = 0
+        self.prepare_progression_audio()
         
         self.update_ui()
         self.result_label.setText("")
         self.disable_chord_buttons(False)
     
+    def prepare_progression_audio(self):
+        """Render the current progression now, so Play only replays a ready sound."""
+        if self.current_frequencies:
+            _play_in_background(self.player.prepare_waveform, *self._progression_mix(1.0))
+    
     def update_ui(self):
         """Update UI to reflect current state."""
         if len(self.user_progression) > 0:
@@ -691,76 +846,41 @@ class ProgressionTrainingWindow(QMainWindow):
         Returns:
             Space-separated note names (e.g., "C E G")
         """
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        notes = []
-        
-        for freq in sorted(frequencies):
-            # Calculate semitones from A4 (440 Hz)
-            semitones_from_a4 = 12 * np.log2(freq / 440.0)
-            
-            # Round to nearest semitone
-            semitone = round(semitones_from_a4)
-            
-            # Calculate octave and note
-            octave = 4 + (semitone + 9) // 12
-            note_index = (semitone + 9) % 12
-            
-            notes.append(f"{note_names[note_index]}{octave}")
-        
-        return " - ".join(notes)
+        return " - ".join(_frequencies_to_note_names(np.sort(frequencies)))
     
     def show_progression_notes(self):
         """Display all chords with their notes stacked vertically to show voice leading."""
         if not self.current_progression or not self.current_frequencies:
             return
         
-        lines = []
-        # Get max number of notes in any chord
-        max_notes = max(len(freqs) for freqs in self.current_frequencies)
-        
-        # For each note position (top to bottom)
-        for note_idx in range(max_notes):
-            line = []
-            for chord_idx, (chord, frequencies) in enumerate(zip(self.current_progression, self.current_frequencies)):
-                # Get notes for this chord sorted in descending order
-                note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-                chord_notes = []
-                for freq in sorted(frequencies, reverse=True):
-                    semitones_from_a4 = 12 * np.log2(freq / 440.0)
-                    semitone = round(semitones_from_a4)
-                    octave = 4 + (semitone + 9) // 12
-                    note_index = (semitone + 9) % 12
-                    chord_notes.append(f"{note_names[note_index]}{octave}")
-                
-                # Add note at this position or blank space
-                if note_idx < len(chord_notes):
-                    line.append(chord_notes[note_idx])
-                else:
-                    line.append("")
+        if self._notes_display_text is None:
+            # Chords as rows with the highest note first, named in one vectorized call
+            padded = -np.sort(-self._frequency_matrix, axis=1)  # Descending, with the NaN padding kept last
             
-            lines.append(line)
-        
-        # Format as a grid
-        display_text = ""
-        for i, line in enumerate(lines):
-            display_text += "  ".join(f"{note:>3}" for note in line).rstrip()
-            if i < len(lines) - 1:
-                display_text += "\n"
-        
-        # Add chord numbers as header
-        chord_nums = "  ".join(f"{c.name:>3}" for c in self.current_progression)
-        full_display = chord_nums + "\n" + "-" * (len(chord_nums)) + "\n" + display_text
+            present = ~np.isnan(padded)
+            names = np.full(padded.shape, "", dtype=object)
+            names[present] = _frequencies_to_note_names(padded[present])
+            
+            # One line per note position (top to bottom), one column per chord
+            display_text = "\n".join("  ".join(f"{note:>3}" for note in line).rstrip() for line in names.T)
+            
+            # Add chord numbers as header
+            chord_nums = "  ".join(f"{c.name:>3}" for c in self.current_progression)
+            self._notes_display_text = chord_nums + "\n" + "-" * (len(chord_nums)) + "\n" + display_text
         
-        self.notes_display_label.setText(full_display)
+        self.notes_display_label.setText(self._notes_display_text)
     
+    @pyqtSlot()
     def on_play_clicked(self):
         """Handle play button click."""
         self.play_progression()
     
+    @pyqtSlot()
     def on_play_arpeggio_clicked(self):
         """Handle play arpeggio button click."""
         self.play_arpeggio()
     
+    @pyqtSlot()
     def on_repeat_clicked(self):
         """Handle repeat button click to replay the current progression without generating a new one."""
         self._play_current_progression()
@@ -768,15 +888,8 @@ class ProgressionTrainingWindow(QMainWindow):
     def _play_current_progression(self):
         """Play the current progression without generating a new one."""
         if self.current_frequencies:
-            root_volume = self.root_volume_slider.value() / 100.0
-            base_delay = 1200  # Base delay in ms (0.8s chord + 0.4s pause)
-            for i, frequencies in enumerate(self.current_frequencies):
-                chord = self.current_progression[i]
-                chord_name = chord.name
-                # Schedule each chord to play with delay, adjusted for playback speed
-                delay = int(i * base_delay / self.playback_speed)
-                QTimer.singleShot(delay, lambda freqs=frequencies, rv=root_volume, c=chord: 
-                                self.play_chord_with_options(freqs, rv, c))
+            # Chord spacing adjusted for playback speed
+            _play_in_background(self.player.play_waveform, *self._progression_mix(self.playback_speed))
     
     def play_progression(self):
         """Play the current progression with spacing between chords."""
@@ -785,14 +898,54 @@ class ProgressionTrainingWindow(QMainWindow):
             self.new_progression()
         
         if self.current_frequencies:
-            root_volume = self.root_volume_slider.value() / 100.0
-            for i, frequencies in enumerate(self.current_frequencies):
-                chord = self.current_progression[i]
-                chord_name = chord.name
-                # Schedule each chord to play with delay
-                delay = i * 1200  # 1.2 seconds between chords (0.8s chord + 0.4s pause)
-                QTimer.singleShot(delay, lambda freqs=frequencies, rv=root_volume, c=chord: 
-                                self.play_chord_with_options(freqs, rv, c))
+            _play_in_background(self.player.play_waveform, *self._progression_mix(1.0))
+    
+    def _progression_mix(self, playback_speed: float):
+        """Snapshot the current progression for rendering into a single buffer.
+        
+        Chord onsets come from the sample buffer rather than from one timer per chord,
+        so the spacing does not jitter with the event loop.
+        
+        Args:
+            playback_speed: Tempo multiplier for the chord spacing
+        
+        Returns:
+            Tuple of (cache key, render callable) for AudioPlayer.play_waveform
+        """
+        frequencies = self.current_frequencies
+        progression = self.current_progression
+        root_volume = self.root_volume_slider.value() / 100.0
+        instrument = self.selected_instrument
+        key = ("progression", tuple(tuple(round(freq, 4) for freq in chord_freqs) for chord_freqs in frequencies),
+               tuple(progression), root_volume, playback_speed, instrument)
+        return key, lambda: self._render_progression(frequencies, progression, root_volume,
+                                                     playback_speed, instrument)
+    
+    def _render_progression(self, frequencies: list, progression: list, root_volume: float,
+                            playback_speed: float, instrument: str) -> np.ndarray:
+        """Mix every chord of a progression into one buffer at its onset.
+        
+        Args:
+            frequencies: Frequencies of each chord
+            progression: ChordNumber of each chord, to find its root
+            root_volume: Multiplier for the root note volume
+            playback_speed: Tempo multiplier for the chord spacing
+            instrument: Instrument type
+        
+        Returns:
+            Mixed progression waveform
+        """
+        # 1.2 seconds between chords (0.8s chord + 0.4s pause) at normal speed
+        onsets = [int(self.player.sample_rate * i * 1.2 / playback_speed) for i in range(len(frequencies))]
+        chord_length = int(self.player.sample_rate * 0.8)
+        waveform = np.zeros(onsets[-1] + chord_length, dtype=np.float32)
+        
+        # Boosted chords are mixed one after another in the same scratch buffer
+        scratch = np.empty(chord_length, dtype=np.float32)
+        for onset, chord_freqs, chord in zip(onsets, frequencies, progression):
+            waveform[onset:onset + chord_length] += self._chord_mix(chord_freqs, root_volume, chord,
+                                                                    instrument, out=scratch)
+        return waveform
     
     def show_chord_notes(self, frequencies: list, chord_name: str):
         """Display the notes for a chord.
@@ -807,95 +960,103 @@ class ProgressionTrainingWindow(QMainWindow):
     def play_arpeggio(self):
         """Play all notes from the progression as an ascending arpeggio."""
         if self.current_frequencies:
-            # Collect all notes from all chords
-            all_notes = []
-            for chord_freqs in self.current_frequencies:
-                all_notes.extend(chord_freqs)
+            # Collect all notes from all chords, sorted in ascending order
+            matrix = self._frequency_matrix
+            all_notes = np.sort(matrix[~np.isnan(matrix)]).tolist()
             
-            # Sort frequencies in ascending order
-            all_notes.sort()
-            
-            # Play each note in sequence for the arpeggio effect
+            # Every note goes out in one buffer at its own onset, so the spacing is exact
             note_duration = 0.3  # Duration per note in arpeggio
-            for i, frequency in enumerate(all_notes):
-                delay = i * 350  # 350ms between each note (0.3s note + 0.05s gap)
-                QTimer.singleShot(delay, lambda freq=frequency: 
-                                self.player.play_tone(freq, duration=note_duration,
-                                                    instrument=self.selected_instrument))
+            notes = [(frequency, note_duration, i * 0.35)  # 350ms between each note (0.3s note + 0.05s gap)
+                     for i, frequency in enumerate(all_notes)]
+            _play_in_background(self.player.play_sequence, notes, instrument=self.selected_instrument)
     
-    def play_chord_with_options(self, frequencies: list, root_volume_multiplier: float, chord: ChordNumber):
-        """Play a chord with adjustable root note volume.
+    def _chord_mix(self, frequencies: list, root_volume_multiplier: float, chord: ChordNumber,
+                   instrument: str, out: np.ndarray | None = None) -> np.ndarray:
+        """Mix a chord with adjustable root note volume.
         
         Args:
             frequencies: List of frequencies for the chord (already inverted)
             root_volume_multiplier: Multiplier for root note volume (1.0 = normal, 2.0 = double)
             chord: The ChordNumber object to identify the actual root note
+            instrument: Instrument type
+            out: Optional float32 buffer of the chord's length to mix a boosted root into
+        
+        Returns:
+            Chord waveform (read-only when the root is not boosted, out when given otherwise)
         """
         if root_volume_multiplier <= 1.0:
-            # Normal playback (100% or less)
-            self.player.play_frequencies(frequencies, duration=0.8, 
-                                        instrument=self.selected_instrument)
-        else:
-            # Calculate the target root frequency based on chord semitone offset
-            # The root note's semitone offset is stored in the chord value
-            chord_semitone_offset = chord.value[0]
-            
-            # Convert semitone offset to Hz from the tonic (C4 = 262 Hz)
-            # A semitone is a factor of 2^(1/12)
-            semitone_factor = 2 ** (1/12)
-            root_hz_at_octave = 262 * (semitone_factor ** chord_semitone_offset)
-            
-            # Find which frequency in the list is the root note (considering octaves)
-            # The root note frequency might be in a different octave than root_hz_at_octave
-            # So we need to find the frequency closest to root_hz_at_octave (within one octave range)
-            root_freq = None
-            min_distance = float('inf')
+            # Normal mix (100% or less)
+            return self._chord_waveform(frequencies, instrument)
+        
+        # Find which frequency in the list is the root note (considering octaves)
+        # The root note might sit in any octave, so compare pitch classes relative to C4
+        freqs = np.asarray(frequencies, dtype=np.float64)
+        valid = freqs > 0
+        if valid.any():
+            # Semitones of every frequency from C4, reduced to the note class
+            note_classes = (np.log2(np.where(valid, freqs, _TONIC_HZ) / _TONIC_HZ) * 12) % 12
+            target_note_class = _CHORD_ROOT_CLASSES[chord]
             
-            for freq in frequencies:
-                # Check if this frequency is close to our target root in any octave
-                # by checking the log ratio
-                if freq > 0:
-                    # Calculate which semitone this frequency is from C4
-                    semitones_from_c4 = np.log2(freq / 262) * 12
-                    # Get the semitone modulo 12 to find the note class
-                    note_class = semitones_from_c4 % 12
-                    target_note_class = chord_semitone_offset % 12
-                    
-                    # Find the circular distance (accounting for octave wrapping)
-                    distance = min(abs(note_class - target_note_class), 
-                                  12 - abs(note_class - target_note_class))
-                    
-                    if distance < min_distance:
-                        min_distance = distance
-                        root_freq = freq
-            
-            if root_freq is None:
-                # Fallback: use lowest frequency if matching fails
-                root_freq = min(frequencies)
-            
-            # Play all frequencies together first (normal)
-            waveform = None
-            for freq in frequencies:
-                tone = self.player.generate_rich_tone(freq, 0.8, self.selected_instrument)
-                if waveform is None:
-                    waveform = tone
-                else:
-                    waveform += tone
-            
-            # Now add the root note with adjustable volume
-            root_tone = self.player.generate_rich_tone(root_freq, 0.8, self.selected_instrument)
-            
-            # Add the root tone with the specified multiplier (minus 1.0 to get the extra amount)
-            extra_root_volume = root_volume_multiplier - 1.0
-            waveform += root_tone * extra_root_volume
-            
-            # Normalize to prevent clipping
-            max_val = max(abs(waveform.min()), abs(waveform.max()))
-            if max_val > 0:
-                waveform = waveform / max_val * 0.95
-            
-            # Play the modified waveform
-            self.player._play_audio(waveform)
+            # Circular distance to the root's note class (accounting for octave wrapping)
+            distances = np.abs(note_classes - target_note_class)
+            distances = np.minimum(distances, 12 - distances)
+            distances[~valid] = np.inf
+            root_freq = frequencies[int(distances.argmin())]
+        else:
+            # Fallback: use lowest frequency if matching fails
+            root_freq = min(frequencies)
+        
+        # Mix all frequencies together first (normal)
+        chord_tone = self._chord_waveform(frequencies, instrument)
+        
+        # Now add the root note with adjustable volume
+        root_tone = self._chord_waveform([root_freq], instrument)
+        
+        # Add the root tone with the specified multiplier (minus 1.0 to get the extra amount),
+        # building the mix in one buffer that the normalisation then scales in place
+        extra_root_volume = root_volume_multiplier - 1.0
+        waveform = np.multiply(root_tone, extra_root_volume, out=out)
+        waveform += chord_tone
+        
+        # Normalize to prevent clipping
+        peak = np.abs(waveform).max()
+        if peak > 0:
+            waveform *= 0.95 / peak
+        
+        return waveform
+    
+    def _chord_waveform(self, frequencies: list, instrument: str) -> np.ndarray:
+        """Return the (read-only, cached) sum of 0.8s tones at frequencies.
+        
+        The cache is cleared by new_progression, so it only ever holds the current
+        chords and their roots.
+        
+        Args:
+            frequencies: Frequencies in Hz to mix
+            instrument: Instrument type
+        
+        Returns:
+            Mixed waveform
+        """
+        key = (tuple(frequencies), instrument)
+        waveform = self._chord_wave_cache.get(key)
+        if waveform is None:
+            waveform = self.player.cached_tone(frequencies[0], 0.8, instrument)
+            if len(frequencies) > 1:
+                waveform = waveform.copy()
+                for freq in frequencies[1:]:
+                    waveform += self.player.cached_tone(freq, 0.8, instrument)
+                waveform.flags.writeable = False
+            with QMutexLocker(self._chord_wave_mutex):
+                if len(self._chord_wave_cache) >= _CHORD_WAVE_CACHE_SIZE:
+                    del self._chord_wave_cache[next(iter(self._chord_wave_cache))]  # Evict the oldest entry
+                self._chord_wave_cache[key] = waveform
+        return waveform
+    
+    @pyqtSlot()
+    def _on_chord_button_clicked(self):
+        """Guess the chord of whichever chord button was clicked."""
+        self.guess_chord(self._chord_by_button[self.sender()])
     
     def guess_chord(self, chord: ChordNumber):
         """Handle chord guess."""
@@ -909,7 +1070,7 @@ class ProgressionTrainingWindow(QMainWindow):
             # Check if user correctly identified the first chord should be I
             if chord != ChordNumber.I:
                 self.result_label.setText("✗ First chord should be I (Tonic)! Try again.")
-                self.result_label.setStyleSheet("color: red; font-weight: bold;")
+                _set_result_state(self.result_label, "wrong")
                 self.user_progression = []
                 self.guessing_index = 0
                 self.update_ui()
@@ -924,6 +1085,7 @@ class ProgressionTrainingWindow(QMainWindow):
         if len(self.user_progression) == len(self.current_progression):
             self.check_answer()
     
+    @pyqtSlot()
     def on_undo_clicked(self):
         """Handle undo button click to remove last chord from answer."""
         if len(self.user_progression) > 0:
@@ -941,14 +1103,7 @@ class ProgressionTrainingWindow(QMainWindow):
         Returns:
             Formatted progression string like "I - iv - V - I"
         """
-        formatted_chords = []
-        for chord in progression:
-            chord_type = chord.value[1]
-            if chord_type in ["minor", "diminished"]:
-                formatted_chords.append(chord.name.lower())
-            else:
-                formatted_chords.append(chord.name)
-        return " - ".join(formatted_chords)
+        return " - ".join(_CHORD_DISPLAY_NAMES[chord] for chord in progression)
     
     def check_answer(self):
         """Check if user's progression matches the current one."""
@@ -959,14 +1114,14 @@ class ProgressionTrainingWindow(QMainWindow):
             self.score += 1
             correct_progression = self.format_progression_string(self.current_progression)
             self.result_label.setText(f"✓ Correct! Progression: {correct_progression}")
-            self.result_label.setStyleSheet("color: green; font-weight: bold;")
+            _set_result_state(self.result_label, "correct")
         else:
             correct_progression = self.format_progression_string(self.current_progression)
             user_progression = self.format_progression_string(self.user_progression)
             self.result_label.setText(
                 f"✗ Wrong. Correct: {correct_progression}, You said: {user_progression}"
             )
-            self.result_label.setStyleSheet("color: red; font-weight: bold;")
+            _set_result_state(self.result_label, "wrong")
         
         self.score_label.setText(f"Score: {self.score}/{self.total}")
         self.disable_chord_buttons(True)
@@ -974,47 +1129,59 @@ class ProgressionTrainingWindow(QMainWindow):
         # Show the chord notes stacked to visualize voice leading
         self.show_progression_notes()
     
+    @pyqtSlot()
     def on_root_volume_changed(self):
         """Handle root volume slider change."""
-        value = self.root_volume_slider.value()
-        self.root_volume_value_label.setText(f"{value}%")
+        self._slider_debounce.start()
     
+    @pyqtSlot()
     def on_playback_speed_changed(self):
         """Handle playback speed slider change."""
-        value = self.playback_speed_slider.value()
-        self.playback_speed = value / 100.0
+        self.playback_speed = self.playback_speed_slider.value() / 100.0
+        self._slider_debounce.start()
+    
+    @pyqtSlot()
+    def _apply_slider_state(self):
+        """Refresh the slider value labels once a drag has settled."""
+        self.root_volume_value_label.setText(f"{self.root_volume_slider.value()}%")
         self.playback_speed_value_label.setText(f"{self.playback_speed:.1f}x")
     
+    @pyqtSlot()
     def on_start_on_tonic_changed(self):
         """Handle start on tonic checkbox change."""
         self.start_on_tonic = self.start_on_tonic_checkbox.isChecked()
         self.new_progression()
     
+    @pyqtSlot()
     def on_use_common_changed(self):
         """Handle use common progressions only checkbox change."""
         self.use_common_only = self.use_common_checkbox.isChecked()
         self.new_progression()
     
+    @pyqtSlot()
     def on_play_tonic_clicked(self):
         """Handle play tonic button click."""
         # Play C4 (tonic) for 1 second
-        tonic_freq = 262.0  # C4
-        self.player.play_tone(tonic_freq, duration=1.0, instrument=self.selected_instrument)
+        _play_in_background(self.player.play_tone, _TONIC_HZ, duration=1.0, instrument=self.selected_instrument)
     
     def disable_chord_buttons(self, disabled: bool):
         """Disable/enable chord buttons."""
         for btn in self.chord_buttons.values():
             btn.setEnabled(not disabled)
     
+    @pyqtSlot()
     def on_instrument_changed(self):
         """Handle instrument selection change."""
         text = self.instrument_combo.currentText()
         self.selected_instrument = text.lower()
+        self.prepare_progression_audio()
     
+    @pyqtSlot()
     def on_num_chords_changed(self):
         """Handle number of chords selection change."""
         self.new_progression()
     
+    @pyqtSlot()
     def exit_training(self):
         """Exit training and show final score."""
         if self.total > 0:
@@ -1025,11 +1192,6 @@ class ProgressionTrainingWindow(QMainWindow):
                 f"Final Score: {self.score}/{self.total} ({percentage:.1f}%)"
             )
         self.close()
-    
-    def closeEvent(self, event):
-        """Handle window close event and clean up resources."""
-        pygame.mixer.quit()
-        event.accept()
 
 
 class NoteTrainingWindow(QMainWindow):
@@ -1050,8 +1212,11 @@ class NoteTrainingWindow(QMainWindow):
         self.octave_combo = None
         self.max_interval_combo = None
         self.note_buttons = {}
+        self._note_by_button = {}
         self.keyboard_container = None
-        self.available_notes = list(Note)  # All notes available by default
+        self._white_keys = []  # (octave index, note, button) of every key, shown or not
+        self._black_keys = []
+        self.available_notes = _ALL_NOTES  # All notes available by default
         
         self.init_ui()
     
@@ -1065,18 +1230,18 @@ class NoteTrainingWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         
         title = QLabel("Note Recognition Training")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
         
         self.score_label = QLabel(f"Score: {self.score}/{self.total}")
-        self.score_label.setFont(QFont("Arial", 14))
+        self.score_label.setFont(_FONT_SCORE)
         layout.addWidget(self.score_label)
         
         instrument_layout = QHBoxLayout()
         instrument_label = QLabel("Instrument:")
-        instrument_label.setFont(QFont("Arial", 12))
+        instrument_label.setFont(_FONT_BODY)
         self.instrument_combo = QComboBox()
-        self.instrument_combo.setFont(QFont("Arial", 11))
+        self.instrument_combo.setFont(_FONT_CONTROL)
         self.instrument_combo.addItems(["Piano", "Bell", "Violin", "Flute"])
         self.instrument_combo.activated.connect(self.on_instrument_changed)
         self.selected_instrument = "piano"
@@ -1086,9 +1251,9 @@ class NoteTrainingWindow(QMainWindow):
         
         # Add octave range selector
         octave_label = QLabel("Octave Range:")
-        octave_label.setFont(QFont("Arial", 12))
+        octave_label.setFont(_FONT_BODY)
         self.octave_combo = QComboBox()
-        self.octave_combo.setFont(QFont("Arial", 11))
+        self.octave_combo.setFont(_FONT_CONTROL)
         self.octave_combo.addItems(["1 Octave", "2 Octaves", "3 Octaves"])
         self.octave_combo.setCurrentIndex(2)  # Default to 3 octaves
         self.octave_combo.activated.connect(self.on_octave_range_changed)
@@ -1098,9 +1263,9 @@ class NoteTrainingWindow(QMainWindow):
         
         # Add max interval selector
         max_interval_label = QLabel("Max Interval:")
-        max_interval_label.setFont(QFont("Arial", 12))
+        max_interval_label.setFont(_FONT_BODY)
         self.max_interval_combo = QComboBox()
-        self.max_interval_combo.setFont(QFont("Arial", 11))
+        self.max_interval_combo.setFont(_FONT_CONTROL)
         # Add options from 1 octave (12 semitones) to 2 octaves (24 semitones)
         interval_options = [
             "Octave (12)",
@@ -1126,22 +1291,22 @@ class NoteTrainingWindow(QMainWindow):
         layout.addLayout(instrument_layout)
         
         instructions = QLabel("Listen to the note, then click the correct note")
-        instructions.setFont(QFont("Arial", 12))
+        instructions.setFont(_FONT_BODY)
         layout.addWidget(instructions)
         
         # Add reference note button
         ref_button = QPushButton("▶ Play Reference Note (A)")
-        ref_button.setFont(QFont("Arial", 11))
+        ref_button.setFont(_FONT_CONTROL)
         ref_button.clicked.connect(self.play_reference)
         layout.addWidget(ref_button)
         
         self.play_button = QPushButton("▶ Play Note")
-        self.play_button.setFont(QFont("Arial", 12))
+        self.play_button.setFont(_FONT_BODY)
         self.play_button.clicked.connect(self.on_play_clicked)
         layout.addWidget(self.play_button)
         
         self.result_label = QLabel("")
-        self.result_label.setFont(QFont("Arial", 12))
+        self.result_label.setFont(_FONT_BODY)
         self.result_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_label)
         
@@ -1149,10 +1314,16 @@ class NoteTrainingWindow(QMainWindow):
         self.rebuild_keyboard()
         
         exit_button = QPushButton("Exit")
-        exit_button.setFont(QFont("Arial", 12))
+        exit_button.setFont(_FONT_BODY)
         exit_button.clicked.connect(self.exit_training)
         layout.addWidget(exit_button)
         
+        # One reusable timer moves on to the next question after each answer
+        self._advance_timer = QTimer(self)
+        self._advance_timer.setSingleShot(True)
+        self._advance_timer.setInterval(2000)
+        self._advance_timer.timeout.connect(self.advance_to_next)
+        
         self.new_note()
         
         # Manually trigger on_max_interval_changed to properly initialize
@@ -1165,20 +1336,37 @@ class NoteTrainingWindow(QMainWindow):
         self.result_label.setText("")
         self.disable_note_buttons(False)
     
+    def prepare_note_audio(self):
+        """Render the reference and every note in the octave range now, so playback only replays ready sounds."""
+        _, ref_freq = self.trainer.get_reference_note()
+        low_octave, high_octave = self.trainer.octave_range
+        frequencies = [ref_freq] + [self.trainer.get_note_frequency(note, octave)
+                                    for octave in range(low_octave, high_octave + 1)
+                                    for note in self.available_notes]
+        _play_in_background(self.player.prepare_tones, frequencies, duration=0.8,
+                            instrument=self.selected_instrument)
+    
+    @pyqtSlot()
     def play_reference(self):
         """Play the reference note (A)."""
         ref_note, ref_freq = self.trainer.get_reference_note()
-        self.player.play_tone(ref_freq, duration=0.8, instrument=self.selected_instrument)
+        _play_in_background(self.player.play_tone, ref_freq, duration=0.8, instrument=self.selected_instrument)
     
+    @pyqtSlot()
     def on_play_clicked(self):
         """Handle play button click."""
         self.play_note()
     
     def play_note(self):
         """Play the current note."""
-        if self.current_note:
+        if self.current_note is not None:
             freq = self.trainer.get_current_frequency()
-            self.player.play_tone(freq, duration=0.8, instrument=self.selected_instrument)
+            _play_in_background(self.player.play_tone, freq, duration=0.8, instrument=self.selected_instrument)
+    
+    @pyqtSlot()
+    def _on_note_button_clicked(self):
+        """Guess the note and octave of whichever key was clicked."""
+        self.guess_note(*self._note_by_button[self.sender()])
     
     def guess_note(self, note: Note, octave: int):
         """Handle note guess."""
@@ -1188,34 +1376,38 @@ class NoteTrainingWindow(QMainWindow):
         if is_correct:
             self.score += 1
             self.result_label.setText(f"✓ Correct! It was {self.current_note.display_name}{self.current_octave}")
-            self.result_label.setStyleSheet("color: green; font-weight: bold;")
+            _set_result_state(self.result_label, "correct")
         else:
             self.result_label.setText(
                 f"✗ Wrong. Correct answer: {self.current_note.display_name}{self.current_octave}, You said: {note.display_name}{octave}"
             )
-            self.result_label.setStyleSheet("color: red; font-weight: bold;")
+            _set_result_state(self.result_label, "wrong")
         
         self.score_label.setText(f"Score: {self.score}/{self.total}")
         self.disable_note_buttons(True)
         self.current_note, self.current_octave = self.trainer.generate_note(self.available_notes, max_interval=self.max_interval_semitones)
-        QTimer.singleShot(2000, self.advance_to_next)
+        self._advance_timer.start()
     
     def disable_note_buttons(self, disabled: bool):
         """Disable/enable note buttons."""
         for btn in self.note_buttons.values():
             btn.setEnabled(not disabled)
     
+    @pyqtSlot()
     def advance_to_next(self):
         """Prepare UI for next note."""
         self.result_label.setText("")
         self.disable_note_buttons(False)
         self.play_note()
     
+    @pyqtSlot()
     def on_instrument_changed(self):
         """Handle instrument selection change."""
         text = self.instrument_combo.currentText()
         self.selected_instrument = text.lower()
+        self.prepare_note_audio()
     
+    @pyqtSlot()
     def on_octave_range_changed(self):
         """Handle octave range selection change."""
         index = self.octave_combo.currentIndex()
@@ -1240,7 +1432,9 @@ class NoteTrainingWindow(QMainWindow):
         
         # Generate new note with updated range
         self.new_note()
+        self.prepare_note_audio()
     
+    @pyqtSlot()
     def on_max_interval_changed(self):
         """Handle max interval selection change."""
         index = self.max_interval_combo.currentIndex()
@@ -1249,14 +1443,14 @@ class NoteTrainingWindow(QMainWindow):
         self.max_interval_semitones = 12 + index
         
         # Update available notes
-        all_notes = list(Note)
-        self.available_notes = all_notes
+        self.available_notes = _ALL_NOTES
         
         # Rebuild keyboard
         self.rebuild_keyboard()
         
         # Regenerate note with updated constraints
         self.new_note()
+        self.prepare_note_audio()
     
     def _apply_max_interval_constraint(self):
         """Apply max interval constraint to the octave range."""
@@ -1284,18 +1478,12 @@ class NoteTrainingWindow(QMainWindow):
     
     def rebuild_keyboard(self):
         """Rebuild the keyboard with current octave settings."""
-        # Clear existing keyboard
-        if self.keyboard_container:
-            # Remove all child widgets from keyboard container
-            for btn in self.note_buttons.values():
-                btn.deleteLater()
-            self.note_buttons.clear()
-            self.keyboard_container.deleteLater()
-        
-        # Recreate keyboard container
-        self.keyboard_container = QWidget()
-        self.keyboard_container.setMinimumHeight(180)
-        self.keyboard_container.setMaximumHeight(180)
+        # The keys for the largest range are created once, then re-labelled, placed and shown here
+        if self.keyboard_container is None:
+            self._create_keyboard()
+        self.note_buttons.clear()
+        self._note_by_button.clear()
+        
         if self.num_octaves == 1:
             self.keyboard_container.setMinimumWidth(500)
         elif self.num_octaves == 2:
@@ -1307,84 +1495,60 @@ class NoteTrainingWindow(QMainWindow):
         start_octave = self.trainer.octave_range[0]
         
         # White keys
-        white_notes = [Note.C, Note.D, Note.E, Note.F, Note.G, Note.A, Note.B]
         # Filter by available notes
-        white_notes = [n for n in white_notes if n in self.available_notes]
-        white_key_width = 70
-        white_key_height = 150
-        
-        # Create octaves of white keys
-        for octave in range(self.num_octaves):
-            for i, note in enumerate(white_notes):
-                key_position = (octave * 7 + i) * white_key_width
-                label = f"{note.display_name}{start_octave + octave}"
-                btn = QPushButton(label, self.keyboard_container)
-                btn.setGeometry(key_position, 30, white_key_width - 2, white_key_height)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: white;
-                        border: 2px solid #333;
-                        border-radius: 0px 0px 5px 5px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #e0e0e0;
-                    }
-                    QPushButton:disabled {
-                        background-color: #cccccc;
-                    }
-                """)
-                btn.clicked.connect(lambda checked, n=note, o=start_octave + octave: self.guess_note(n, o))
-                self.note_buttons[note] = btn
+        white_notes = [n for n in _WHITE_KEY_NOTES if n in self.available_notes]
+        
+        for octave, note, btn in self._white_keys:
+            if octave >= self.num_octaves or note not in white_notes:
+                btn.hide()
+                continue
+            key_position = (octave * 7 + white_notes.index(note)) * _WHITE_KEY_WIDTH
+            btn.setText(f"{note.display_name}{start_octave + octave}")
+            btn.setGeometry(key_position, 30, _WHITE_KEY_WIDTH - 2, _WHITE_KEY_HEIGHT)
+            btn.show()
+            self.note_buttons[note] = btn
+            self._note_by_button[btn] = (note, start_octave + octave)
         
         # Black keys
-        black_notes_info = [
-            (Note.C_SHARP, 0.7),
-            (Note.D_SHARP, 1.7),
-            (Note.F_SHARP, 3.7),
-            (Note.G_SHARP, 4.7),
-            (Note.A_SHARP, 5.7),
-        ]
-        # Filter by available notes
-        black_notes_info = [(n, p) for n, p in black_notes_info if n in self.available_notes]
-        
-        black_key_width = 45
-        black_key_height = 100
-        
-        # Create octaves of black keys
-        for octave in range(self.num_octaves):
-            for note, relative_position in black_notes_info:
-                position = (octave * 7 + relative_position) * white_key_width
-                label = f"{note.display_name}{start_octave + octave}"
-                btn = QPushButton(label, self.keyboard_container)
-                btn.setGeometry(int(position) - black_key_width // 2, 30, black_key_width, black_key_height)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #1a1a1a;
-                        color: white;
-                        border: 2px solid #000;
-                        border-radius: 0px 0px 3px 3px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #333333;
-                    }
-                    QPushButton:disabled {
-                        background-color: #555555;
-                    }
-                """)
-                btn.clicked.connect(lambda checked, n=note, o=start_octave + octave: self.guess_note(n, o))
-                self.note_buttons[note] = btn
+        for octave, note, btn in self._black_keys:
+            if octave >= self.num_octaves or note not in self.available_notes:
+                btn.hide()
+                continue
+            position = (octave * 7 + _BLACK_KEY_POSITIONS[note]) * _WHITE_KEY_WIDTH
+            btn.setText(f"{note.display_name}{start_octave + octave}")
+            btn.setGeometry(int(position) - _BLACK_KEY_WIDTH // 2, 30, _BLACK_KEY_WIDTH, _BLACK_KEY_HEIGHT)
+            btn.show()
+            self.note_buttons[note] = btn
+            self._note_by_button[btn] = (note, start_octave + octave)
+    
+    def _create_keyboard(self):
+        """Create the keyboard container with keys for every octave the range can show."""
+        self.keyboard_container = QWidget()
+        self.keyboard_container.setMinimumHeight(180)
+        self.keyboard_container.setMaximumHeight(180)
+        
+        for octave in range(_MAX_KEYBOARD_OCTAVES):
+            for note in _WHITE_KEY_NOTES:
+                btn = QPushButton(self.keyboard_container)
+                btn.setObjectName("whiteKey")
+                btn.clicked.connect(self._on_note_button_clicked)
+                self._white_keys.append((octave, note, btn))
+        
+        # Black keys are created last and raised, so they sit on top of the white keys
+        for octave in range(_MAX_KEYBOARD_OCTAVES):
+            for note in _BLACK_KEY_POSITIONS:
+                btn = QPushButton(self.keyboard_container)
+                btn.setObjectName("blackKey")
+                btn.clicked.connect(self._on_note_button_clicked)
                 btn.raise_()
+                self._black_keys.append((octave, note, btn))
         
-        # Add keyboard container to the layout (find and replace in parent)
-        # We need to insert it at the right position in the parent layout
+        # Add keyboard container to the layout
         parent_layout = self.centralWidget().layout()
         # Insert before the exit button (which should be the last widget)
         parent_layout.insertWidget(parent_layout.count() - 1, self.keyboard_container)
     
+    @pyqtSlot()
     def exit_training(self):
         """Exit training and show final score."""
         if self.total > 0:
@@ -1395,11 +1559,6 @@ class NoteTrainingWindow(QMainWindow):
                 f"Final Score: {self.score}/{self.total} ({percentage:.1f}%)"
             )
         self.close()
-    
-    def closeEvent(self, event):
-        """Handle window close event and clean up resources."""
-        pygame.mixer.quit()
-        event.accept()
 
 
 class MainMenu(QMainWindow):
@@ -1421,7 +1580,7 @@ class MainMenu(QMainWindow):
         
         # Title
         title = QLabel("Ear Training")
-        title.setFont(QFont("Arial", 24, QFont.Bold))
+        title.setFont(_FONT_MENU_TITLE)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -1430,35 +1589,35 @@ class MainMenu(QMainWindow):
         
         # Interval button
         interval_btn = QPushButton("🎵 Interval Recognition")
-        interval_btn.setFont(QFont("Arial", 14))
+        interval_btn.setFont(_FONT_SCORE)
         interval_btn.setMinimumHeight(60)
         interval_btn.clicked.connect(self.start_interval_training)
         layout.addWidget(interval_btn)
         
         # Note button
         note_btn = QPushButton("🎹 Note Recognition")
-        note_btn.setFont(QFont("Arial", 14))
+        note_btn.setFont(_FONT_SCORE)
         note_btn.setMinimumHeight(60)
         note_btn.clicked.connect(self.start_note_training)
         layout.addWidget(note_btn)
         
         # Chord button
         chord_btn = QPushButton("🎼 Chord Recognition")
-        chord_btn.setFont(QFont("Arial", 14))
+        chord_btn.setFont(_FONT_SCORE)
         chord_btn.setMinimumHeight(60)
         chord_btn.clicked.connect(self.start_chord_training)
         layout.addWidget(chord_btn)
         
         # Progression button
         progression_btn = QPushButton("🎵 Harmonic Progression")
-        progression_btn.setFont(QFont("Arial", 14))
+        progression_btn.setFont(_FONT_SCORE)
         progression_btn.setMinimumHeight(60)
         progression_btn.clicked.connect(self.start_progression_training)
         layout.addWidget(progression_btn)
         
         # Rhythm button
         rhythm_btn = QPushButton("🥁 Rhythm Recognition")
-        rhythm_btn.setFont(QFont("Arial", 14))
+        rhythm_btn.setFont(_FONT_SCORE)
         rhythm_btn.setMinimumHeight(60)
         rhythm_btn.setEnabled(False)  # Coming soon
         layout.addWidget(rhythm_btn)
@@ -1468,28 +1627,32 @@ class MainMenu(QMainWindow):
         
         # Exit button
         exit_btn = QPushButton("Exit")
-        exit_btn.setFont(QFont("Arial", 12))
+        exit_btn.setFont(_FONT_BODY)
         exit_btn.clicked.connect(self.close)
         layout.addWidget(exit_btn)
     
+    @pyqtSlot()
     def start_interval_training(self):
         """Start interval training."""
         self.training_window = IntervalTrainingWindow()
         self.training_window.show()
         self.close()
     
+    @pyqtSlot()
     def start_note_training(self):
         """Start note recognition training."""
         self.training_window = NoteTrainingWindow()
         self.training_window.show()
         self.close()
 
+    @pyqtSlot()
     def start_chord_training(self):
         """Start chord training."""
         self.training_window = ChordTrainingWindow()
         self.training_window.show()
         self.close()
     
+    @pyqtSlot()
     def start_progression_training(self):
         """Start harmonic progression training."""
         self.training_window = ProgressionTrainingWindow()
@@ -1500,6 +1663,10 @@ class MainMenu(QMainWindow):
 def main_gui():
     """Run the GUI application."""
     app = QApplication(sys.argv)
+    app.setStyleSheet(_APP_STYLE_SHEET)
+    # One mixer for the whole session; windows come and go without reopening it
+    init_audio()
+    app.aboutToQuit.connect(pygame.mixer.quit)
     menu = MainMenu()
     menu.show()
     sys.exit(app.exec_())
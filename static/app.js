@@ -1,5 +1,12 @@
 const { createApp } = Vue;
 
+// Shared Web Audio context, created on first playback (browsers require a user gesture)
+let audioContext = null;
+
+// Decoded chord buffers by request, most recently used last
+const CHORD_BUFFER_CACHE_SIZE = 64;
+const chordBufferCache = new Map();
+
 createApp({
     data() {
         return {
@@ -272,36 +279,72 @@ createApp({
             this.isPlaying = false;
         },
 
+        getAudioContext() {
+            if (!audioContext) {
+                audioContext = new AudioContext();
+            }
+            if (audioContext.state === 'suspended') {
+                audioContext.resume();
+            }
+            return audioContext;
+        },
+
         async fetchChordAudio(frequencies, chordName) {
             try {
-                const response = await fetch('/api/play-chord', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        frequencies: frequencies,
-                        instrument: this.selectedInstrument.toLowerCase(),
-                        playback_speed: this.playbackSpeed,
-                        // Map 100–1000% slider to a 1.0–10.0x root multiplier
-                        root_volume_multiplier: this.rootVolume / 100.0,
-                        chord_name: chordName
-                    })
+                const body = JSON.stringify({
+                    frequencies: frequencies,
+                    instrument: this.selectedInstrument.toLowerCase(),
+                    playback_speed: this.playbackSpeed,
+                    // Map 100–1000% slider to a 1.0–10.0x root multiplier
+                    root_volume_multiplier: this.rootVolume / 100.0,
+                    chord_name: chordName
                 });
+                const ctx = this.getAudioContext();
                 
-                if (!response.ok) {
-                    console.error('Error response from server:', response.status);
-                    return null;
+                // Replaying a chord reuses its buffer instead of fetching it again
+                let buffer = chordBufferCache.get(body);
+                if (buffer) {
+                    chordBufferCache.delete(body);
+                } else {
+                    const response = await fetch('/api/play-chord?format=f32', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: body
+                    });
+                    
+                    if (!response.ok) {
+                        console.error('Error response from server:', response.status);
+                        return null;
+                    }
+                    
+                    // Raw float32 samples go straight into an AudioBuffer, no WAV decoding
+                    const samples = new Float32Array(await response.arrayBuffer());
+                    console.log('Received chord samples:', samples.length);
+                    
+                    const sampleRate = Number(response.headers.get('X-Sample-Rate')) || 44100;
+                    buffer = ctx.createBuffer(1, samples.length, sampleRate);
+                    buffer.copyToChannel(samples, 0);
+                    
+                    if (chordBufferCache.size >= CHORD_BUFFER_CACHE_SIZE) {
+                        // Evict the least recently used chord
+                        chordBufferCache.delete(chordBufferCache.keys().next().value);
+                    }
                 }
+                chordBufferCache.set(body, buffer);
                 
-                const audioBlob = await response.blob();
-                console.log('Received audio blob:', audioBlob.size, 'bytes');
-                
-                const audioUrl = URL.createObjectURL(audioBlob);
-                const audio = new Audio(audioUrl);
-                audio.volume = 0.8; // Set volume to 80%
-
-                return audio;
+                // Same interface as an Audio element for the playback scheduler
+                return {
+                    play: () => {
+                        const source = ctx.createBufferSource();
+                        const gain = ctx.createGain();
+                        gain.gain.value = 0.8; // Set volume to 80%
+                        source.buffer = buffer;
+                        source.connect(gain).connect(ctx.destination);
+                        source.start();
+                    }
+                };
             } catch (error) {
                 console.error('Error fetching chord audio:', error);
                 return null;
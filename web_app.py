@@ -1,13 +1,23 @@
 """Flask web app for ear training."""
 
-from flask import Flask, jsonify, request, send_file, send_from_directory
-from flask_cors import CORS
-import io
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from functools import lru_cache
+import hashlib
 import json
 import os
+import struct
+import threading
 import numpy as np
-import scipy.io.wavfile as wavfile
-from ear_training.modules.progressions import ProgressionTrainer, ChordNumber
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from ear_training.modules.progressions import ProgressionTrainer, ChordNumber, CHORD_NUMBER_BY_NAME
 from ear_training.ui.audio_player import AudioPlayer
 
 # Get the directory where this script is located
@@ -16,33 +26,203 @@ STATIC_DIR = os.path.join(BASE_DIR, 'static')
 CUSTOM_PROGRESSIONS_FILE = os.path.join(BASE_DIR, 'custom_progressions.json')
 DEACTIVATED_CHORDS_FILE = os.path.join(BASE_DIR, 'deactivated_chords.json')
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider for request and response bodies backed by the faster orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, static_folder=STATIC_DIR, static_url_path='/static')
-CORS(app)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+# CORS headers for every response, so a separately deployed frontend can use the API
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT',
+    'Access-Control-Expose-Headers': 'ETag, X-Sample-Rate',
+}
 
-# Initialize trainers and players
+# Static assets linked from index.html; their URLs change with their content
+VERSIONED_ASSETS = ('style.css', 'app.js')
+
+@app.after_request
+def cache_versioned_assets(response):
+    """Let browsers keep versioned static assets, whose URL changes with their content."""
+    if request.path.startswith('/static/') and 'v' in request.args and response.status_code == 200:
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+@app.after_request
+def add_cors_headers(response):
+    """Allow cross-origin requests, granting preflights the headers they ask for."""
+    response.headers.update(CORS_HEADERS)
+    requested_headers = request.headers.get('Access-Control-Request-Headers')
+    if requested_headers:
+        response.headers['Access-Control-Allow-Headers'] = requested_headers
+    return response
+
+# Initialize trainers; audio players are created per instrument on first use
 progression_trainer = ProgressionTrainer()
-audio_players = {
-    "piano": AudioPlayer(sample_rate=44100, duration=0.8),
-    "bell": AudioPlayer(sample_rate=44100, duration=0.8),
-    "violin": AudioPlayer(sample_rate=44100, duration=0.8),
-    "flute": AudioPlayer(sample_rate=44100, duration=0.8),
+INSTRUMENTS = ('piano', 'bell', 'violin', 'flute')
+
+# Display name of every chord - must match frontend's chordEnumToDisplay function
+CHORD_DISPLAY_NAMES = {
+    chord: {
+        ChordNumber.IMAJ7: "Imaj7",
+        ChordNumber.II: "ii",
+        ChordNumber.IIM7: "ii7",
+        ChordNumber.III: "iii",
+        ChordNumber.IIIM7: "iii7",
+        ChordNumber.IIIAUG: "III+",
+        ChordNumber.IVMAJ7: "IVmaj7",
+        ChordNumber.VI: "vi",
+        ChordNumber.VIM7: "vi7",
+        ChordNumber.VII: "vii°",
+        ChordNumber.VIIM7B5: "viiø7",
+    }.get(chord, chord.name)
+    for chord in ChordNumber
 }
 
-def load_custom_progressions():
-    """Load custom progressions from file."""
-    if os.path.exists(CUSTOM_PROGRESSIONS_FILE):
+# Display and enum names accepted for answers, mapped to their chords
+CHORD_BY_DISPLAY_NAME = {
+    'I': ChordNumber.I,
+    'IMAJ7': ChordNumber.IMAJ7,
+    'Imaj7': ChordNumber.IMAJ7,
+    'II': ChordNumber.II,
+    'ii': ChordNumber.II,
+    'II7': ChordNumber.IIM7,
+    'ii7': ChordNumber.IIM7,
+    'III': ChordNumber.III,
+    'iii': ChordNumber.III,
+    'iii7': ChordNumber.IIIM7,
+    'IIIAUG': ChordNumber.IIIAUG,
+    'III+': ChordNumber.IIIAUG,
+    'III7': ChordNumber.III7,
+    'IV': ChordNumber.IV,
+    'IVMAJ7': ChordNumber.IVMAJ7,
+    'IVmaj7': ChordNumber.IVMAJ7,
+    'V': ChordNumber.V,
+    'V7': ChordNumber.V7,
+    'VI': ChordNumber.VI,
+    'vi': ChordNumber.VI,
+    'VI7': ChordNumber.VIM7,
+    'vi7': ChordNumber.VIM7,
+    'VII': ChordNumber.VII,
+    'vii°': ChordNumber.VII,
+    'VII7': ChordNumber.VIIM7B5,
+    'viiø7': ChordNumber.VIIM7B5,
+}
+
+# Chords by upper-cased spelling, for names not in CHORD_BY_DISPLAY_NAME: enum names,
+# optionally with a trailing '°', plus a few legacy spellings
+CHORD_BY_UPPER_NAME = {**CHORD_NUMBER_BY_NAME, 'III+': ChordNumber.IIIAUG}
+CHORD_BY_UPPER_NAME.update({f'{name}°': chord for name, chord in CHORD_BY_UPPER_NAME.items()})
+CHORD_BY_UPPER_NAME['VII°SLASH'] = ChordNumber.VIIM7B5
+
+def lookup_chord(name):
+    """Look up a chord by display name or case-insensitive enum name, or None if unknown."""
+    chord = CHORD_BY_DISPLAY_NAME.get(name)
+    if chord is None:
+        chord = CHORD_BY_UPPER_NAME.get(name.upper())
+    return chord
+
+# Chords are played at a fixed duration; playback_speed only affects spacing on frontend
+CHORD_DURATION = 0.8
+# Longest tone play-tone will render; the frontend never asks for more than 1s
+MAX_TONE_DURATION = 2.0
+
+# Number of rendered chord and tone responses kept for repeated requests
+CHORD_RESPONSE_CACHE_SIZE = 128
+TONE_RESPONSE_CACHE_SIZE = 64
+
+@lru_cache(maxsize=None)
+def get_player(instrument):
+    """Create the audio player for an instrument, with every progression pitch synthesised."""
+    player = AudioPlayer(sample_rate=44100, duration=0.8)
+    # Progressions only ever voice a few dozen pitches, so synthesise them all up front
+    for freq in progression_trainer.get_all_frequencies():
+        player.cached_tone(float(freq), CHORD_DURATION, instrument)
+    return player
+
+# Parsed JSON files by path, with the (mtime, size) stamp they were read at
+_json_cache = {}
+
+def _file_stamp(path):
+    """Return a stamp that changes whenever the file is rewritten."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _load_json_list(path):
+    """Load a JSON list from file, reusing the parsed list while the file is unchanged."""
+    try:
+        stamp = _file_stamp(path)
+    except OSError:
+        return []
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != stamp:
         try:
-            with open(CUSTOM_PROGRESSIONS_FILE, 'r') as f:
-                return json.load(f)
-        except:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        except Exception:
             return []
-    return []
+        cached = _json_cache[path] = (stamp, data)
+    # Callers may modify the list they get, so hand out a copy
+    return list(cached[1])
+
+def _save_json_list(path, data):
+    """Save a JSON list to file and remember it, so the next load skips the read.
+    
+    The list is written to a temporary file that then replaces the original, so a
+    crash mid-write never leaves a truncated file behind.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2).encode()
+    # Unique per process and thread, so concurrent saves never share a temporary file
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    _json_cache[path] = (_file_stamp(path), list(data))
+
+# index.html with versioned asset links, by path, with the stamps it was built from
+_index_cache = {}
+
+def versioned_index_html():
+    """Return index.html with each linked asset's URL versioned by a hash of its content."""
+    paths = [os.path.join(STATIC_DIR, name) for name in ('index.html',) + VERSIONED_ASSETS]
+    stamps = tuple(_file_stamp(path) for path in paths)
+    cached = _index_cache.get(paths[0])
+    if cached is None or cached[0] != stamps:
+        with open(paths[0], encoding='utf-8') as f:
+            html = f.read()
+        for name, path in zip(VERSIONED_ASSETS, paths[1:]):
+            with open(path, 'rb') as f:
+                version = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+            html = html.replace(f'"/static/{name}"', f'"/static/{name}?v={version}"')
+        cached = _index_cache[paths[0]] = (stamps, html)
+    return cached[1]
+
+def load_custom_progressions():
+    """Load custom progressions from file."""
+    return _load_json_list(CUSTOM_PROGRESSIONS_FILE)
 
 def save_custom_progressions(progressions):
     """Save custom progressions to file."""
     try:
-        with open(CUSTOM_PROGRESSIONS_FILE, 'w') as f:
-            json.dump(progressions, f, indent=2)
+        _save_json_list(CUSTOM_PROGRESSIONS_FILE, progressions)
         return True
     except Exception as e:
         print(f"Error saving custom progressions: {e}")
@@ -50,24 +230,156 @@ def save_custom_progressions(progressions):
 
 def load_deactivated_chords():
     """Load deactivated chords from file."""
-    if os.path.exists(DEACTIVATED_CHORDS_FILE):
-        try:
-            with open(DEACTIVATED_CHORDS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return []
-    return []
+    return _load_json_list(DEACTIVATED_CHORDS_FILE)
 
 def save_deactivated_chords(chords):
     """Save deactivated chords to file."""
     try:
-        with open(DEACTIVATED_CHORDS_FILE, 'w') as f:
-            json.dump(chords, f, indent=2)
+        _save_json_list(DEACTIVATED_CHORDS_FILE, chords)
         return True
     except Exception as e:
         print(f"Error saving deactivated chords: {e}")
         return False
 
+def encode_wav(pcm16):
+    """Encode mono 16-bit samples at 44.1 kHz as WAV file bytes."""
+    n = pcm16.nbytes
+    buf = bytearray(44 + n)
+    struct.pack_into('<4sI4s4sIHHIIHH4sI', buf, 0, b'RIFF', 36 + n, b'WAVE', b'fmt ', 16,
+                     1, 1, 44100, 88200, 2, 16, b'data', n)
+    buf[44:] = memoryview(pcm16).cast('B')
+    return bytes(buf)
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _normalize_kernel(waveform, out):
+        """Find the peak and write the scaled int16 samples in one compiled pass."""
+        peak = 0.0
+        for value in waveform:
+            peak = max(peak, abs(value))
+        scale = 0.9 * 32767 / peak if peak > 0 else 0.0
+        for i in range(waveform.shape[0]):
+            out[i] = np.int16(waveform[i] * scale)
+else:
+    _normalize_kernel = None
+
+def normalize_to_int16(waveform):
+    """Scale a waveform to a 0.9 peak (leaving headroom) as 16-bit samples."""
+    pcm16 = np.empty(waveform.shape, dtype=np.int16)
+    if _normalize_kernel is not None:
+        _normalize_kernel(waveform, pcm16)
+        return pcm16
+    # Peak from max/min avoids an abs() temporary; the scale is applied while casting
+    peak = max(float(waveform.max()), -float(waveform.min()))
+    scale = 0.9 * 32767 / peak if peak > 0 else 0.0
+    np.multiply(waveform, scale, out=pcm16, casting='unsafe')
+    return pcm16
+
+def encode_chord(waveform, f32):
+    """Normalize a chord waveform as WAV bytes, or as raw float32 samples if f32."""
+    # Raw float32 samples can be copied straight into a Web Audio buffer by the client
+    if f32:
+        peak = max(float(waveform.max()), -float(waveform.min()))
+        if peak > 0:
+            waveform = waveform * np.float32(0.9 / peak)  # Use 0.9 to leave more headroom
+        return waveform.tobytes()
+    
+    # Normalize to prevent clipping and convert to 16-bit samples
+    audio_data = normalize_to_int16(waveform)
+    
+    return encode_wav(audio_data)
+
+@lru_cache(maxsize=CHORD_RESPONSE_CACHE_SIZE)
+def render_chord(frequencies, instrument, root_volume_multiplier, chord_name, f32):
+    """Mix a chord with its root emphasised, as WAV bytes or raw float32 samples if f32."""
+    player = get_player(instrument if instrument in INSTRUMENTS else 'piano')
+    
+    duration = CHORD_DURATION
+    
+    # Generate chord by mixing frequencies with reduced volume
+    num_freqs = len(frequencies)
+    if num_freqs == 1:
+        # A single note needs no mixing or root emphasis; normalization removes its gain
+        return encode_chord(player.cached_tone(frequencies[0], duration, instrument), f32)
+    
+    # Reduce individual tone volume to prevent clipping when mixing
+    # For a chord of n notes, reduce each by 1/sqrt(n) to prevent amplitude explosion
+    tone_volume = 1.0 / np.sqrt(max(num_freqs, 1))
+    
+    # Stack each distinct tone as one row, so the whole mix is one (gains @ tones) product;
+    # a repeated note gets its row's gain once per occurrence instead of a row of its own
+    rows = {}
+    row_of = [rows.setdefault(freq, len(rows)) for freq in frequencies]
+    tones = np.empty((len(rows), int(player.sample_rate * duration)), dtype=np.float32)
+    for freq, row in rows.items():
+        tones[row] = player.cached_tone(freq, duration, instrument)
+    gains = (np.bincount(row_of) * tone_volume).astype(np.float32)
+    
+    # If root volume multiplier is above 1.0, add extra emphasis to the
+    # theoretical root note (not just the lowest/bass note).
+    if root_volume_multiplier > 1.0:
+        root_index = None
+
+        try:
+            # Get semitone offset of this chord's root from C (tonic),
+            # matching the desktop app logic.
+            chord_enum = CHORD_NUMBER_BY_NAME.get(chord_name)
+            if chord_enum is not None:
+                chord_semitone_offset = chord_enum.value[0]
+                target_note_class = chord_semitone_offset % 12
+
+                freqs = np.asarray(frequencies, dtype=np.float64)
+                valid = freqs > 0
+                if valid.any():
+                    # Semitones of every frequency from C4, reduced to the note class
+                    note_classes = (np.log2(np.where(valid, freqs, 262.0) / 262.0) * 12.0) % 12.0
+
+                    # Circular distance to the root's note class; the first closest note wins
+                    distances = np.abs(note_classes - target_note_class)
+                    distances = np.minimum(distances, 12.0 - distances)
+                    distances[~valid] = np.inf
+                    root_index = int(distances.argmin())
+
+        except Exception as e:
+            print(f"Warning: could not determine theoretical root for chord {chord_name}: {e}")
+
+        if root_index is None:
+            # Fallback: use lowest frequency if matching fails
+            root_index = int(np.argmin(frequencies))
+
+        # Add the root tone with the specified multiplier.
+        # A multiplier of 1.0 (0% slider) means no extra root.
+        # Higher values add proportionally more root before final normalization.
+        gains[row_of[root_index]] += max(0.0, root_volume_multiplier - 1.0)
+    
+    return encode_chord(gains @ tones, f32)
+
+@lru_cache(maxsize=TONE_RESPONSE_CACHE_SIZE)
+def render_tone(frequency, instrument, duration):
+    """Render a single normalized tone as WAV bytes."""
+    player = get_player(instrument if instrument in INSTRUMENTS else 'piano')
+    waveform = player.cached_tone(frequency, duration, instrument)
+    
+    # Normalize to prevent clipping and convert to 16-bit samples
+    audio_data = normalize_to_int16(waveform)
+    
+    return encode_wav(audio_data)
+
+def audio_response(render, key, mimetype, headers=None):
+    """Respond with render(*key), letting clients cache it under an ETag of the key.
+    
+    Identical requests give identical audio, so a matching If-None-Match gets a 304
+    and the rendered bytes themselves are cached by render.
+    """
+    etag = hashlib.blake2b(repr((render.__name__, key)).encode(), digest_size=16).hexdigest()
+    headers = {'Cache-Control': 'public, max-age=3600', **(headers or {})}
+    if request.if_none_match.contains(etag):
+        response = Response(status=304, headers=headers)
+    else:
+        response = Response(render(*key), mimetype=mimetype, headers=headers)
+    response.set_etag(etag)
+    return response
+
 @app.route('/api/progression', methods=['POST'])
 def get_progression():
     """Generate a new chord progression."""
@@ -86,111 +398,68 @@ def get_progression():
     # Load deactivated chords
     deactivated_chord_names = set(load_deactivated_chords())
     
-    # Keep generating progressions until we get one without deactivated chords
-    max_attempts = 20
-    attempt = 0
-    valid_progression = False
-    progression = None
-    
-    while not valid_progression and attempt < max_attempts:
-        progression = progression_trainer.generate_progression(
-            num_chords=num_chords,
-            start_on_tonic=start_on_tonic,
-            use_common_only=use_common_only
-        )
-        
-        # Check if progression contains any deactivated chords
-        # Use same name mapping as reference endpoint
-        name_map = {
-            ChordNumber.IMAJ7: "Imaj7",
-            ChordNumber.II: "ii",
-            ChordNumber.IIM7: "ii7",
-            ChordNumber.III: "iii",
-            ChordNumber.IIIM7: "iii7",
-            ChordNumber.IIIAUG: "III+",
-            ChordNumber.IVMAJ7: "IVmaj7",
-            ChordNumber.VI: "vi",
-            ChordNumber.VIM7: "vi7",
-            ChordNumber.VII: "vii°",
-            ChordNumber.VIIM7B5: "viiø7",
-        }
-        
-        has_deactivated = False
-        for chord in progression:
-            chord_display = name_map.get(chord, chord.name)
-            if chord_display in deactivated_chord_names:
-                has_deactivated = True
-                break
-        
-        if not has_deactivated:
-            valid_progression = True
-        
-        attempt += 1
-    
-    if progression is None:
-        return jsonify({'error': 'Could not generate a valid progression'}), 500
+    # Have the trainer avoid deactivated chords instead of rejecting whole progressions
+    deactivated = {chord for chord in ChordNumber
+                   if CHORD_DISPLAY_NAMES[chord] in deactivated_chord_names}
+    progression = progression_trainer.generate_progression(
+        num_chords=num_chords,
+        start_on_tonic=start_on_tonic,
+        use_common_only=use_common_only,
+        excluded=deactivated
+    )
     
     # Get frequencies for the progression
     frequencies = progression_trainer.get_progression_frequencies(use_inversions=True, include_bass_line=include_bass_line)
     
     # Return progression as strings, mapping special chords for display
-    progression_strs = [name_map.get(chord, chord.name) for chord in progression]
+    progression_strs = [CHORD_DISPLAY_NAMES[chord] for chord in progression]
     
     return jsonify({
         'progression': progression_strs,
         'length': len(progression),
-        'frequencies': frequencies
+        'frequencies': [freqs.tolist() for freqs in frequencies]
     })
 
-@app.route('/api/reference', methods=['GET'])
-def get_reference():
-    """Get common progressions and chord reference information."""
-    # Map chord names for display - must match frontend's chordEnumToDisplay function
-    name_map = {
-        ChordNumber.IMAJ7: "Imaj7",
-        ChordNumber.II: "ii",
-        ChordNumber.IIM7: "ii7",
-        ChordNumber.III: "iii",
-        ChordNumber.IIIM7: "iii7",
-        ChordNumber.IIIAUG: "III+",
-        ChordNumber.IVMAJ7: "IVmaj7",
-        ChordNumber.VI: "vi",
-        ChordNumber.VIM7: "vi7",
-        ChordNumber.VII: "vii°",
-        ChordNumber.VIIM7B5: "viiø7",
-    }
-    
+def build_reference():
+    """Build the request-independent part of the /api/reference payload."""
     # Get all common progressions from the trainer
     common_progs = progression_trainer.common_progressions
     
     # Convert to displayable format
     progressions_display = []
     for prog in common_progs:
-        prog_strs = [name_map.get(chord, chord.name) for chord in prog]
+        prog_strs = [CHORD_DISPLAY_NAMES[chord] for chord in prog]
         progressions_display.append(' - '.join(prog_strs))
     
     # All available chords
-    all_chords = [name_map.get(chord, chord.name) for chord in ChordNumber]
+    all_chords = [CHORD_DISPLAY_NAMES[chord] for chord in ChordNumber]
     
     # Extract unique movements from common progressions
     movements = set()
     for prog in common_progs:
         for i in range(len(prog) - 1):
-            current = name_map.get(prog[i], prog[i].name)
-            next_chord = name_map.get(prog[i+1], prog[i+1].name)
+            current = CHORD_DISPLAY_NAMES[prog[i]]
+            next_chord = CHORD_DISPLAY_NAMES[prog[i+1]]
             movements.add(f"{current} → {next_chord}")
     
     movements_sorted = sorted(list(movements))
     
-    # Get deactivated chords
-    deactivated = load_deactivated_chords()
-    
-    return jsonify({
+    return {
         'common_progressions': progressions_display,
         'all_chords': all_chords,
         'chord_movements': movements_sorted,
-        'deactivated_chords': deactivated
-    })
+    }
+
+# The reference payload without its closing brace; only the deactivated chords change
+REFERENCE_JSON_PREFIX = app.json.dumps(build_reference())[:-1]
+
+@app.route('/api/reference', methods=['GET'])
+def get_reference():
+    """Get common progressions and chord reference information."""
+    # Splice the current deactivated chords into the prebuilt payload
+    deactivated = app.json.dumps(load_deactivated_chords())
+    return Response(f'{REFERENCE_JSON_PREFIX}, "deactivated_chords": {deactivated}}}',
+                    mimetype='application/json')
 
 @app.route('/api/custom-progressions', methods=['GET'])
 def get_custom_progressions():
@@ -300,94 +569,12 @@ def play_chord():
     
     print(f"Playing chord {chord_name}: {frequencies} at {playback_speed}x speed")
     
-    # Get the appropriate audio player
-    player = audio_players.get(instrument, audio_players['piano'])
-    
-    # Use fixed chord duration; playback_speed only affects spacing on frontend
-    duration = 0.8
-    
-    # Generate chord by mixing frequencies with reduced volume
-    num_freqs = len(frequencies)
-    
-    # Reduce individual tone volume to prevent clipping when mixing
-    # For a chord of n notes, reduce each by 1/sqrt(n) to prevent amplitude explosion
-    tone_volume = 1.0 / np.sqrt(max(num_freqs, 1))
-    
-    waveform = None
-    for freq in frequencies:
-        tone = player.generate_rich_tone(freq, duration, instrument)
-        # Scale the tone to prevent clipping when mixed
-        tone = tone * tone_volume
-        
-        if waveform is None:
-            waveform = tone.copy()
-        else:
-            waveform = waveform + tone
-    
-    # If root volume multiplier is above 1.0, add extra emphasis to the
-    # theoretical root note (not just the lowest/bass note).
-    if root_volume_multiplier > 1.0:
-        root_freq = None
-
-        try:
-            # Get semitone offset of this chord's root from C (tonic),
-            # matching the desktop app logic.
-            chord_enum = ChordNumber[chord_name] if chord_name in ChordNumber.__members__ else None
-            if chord_enum is not None:
-                chord_semitone_offset = chord_enum.value[0]
-
-                semitone_factor = 2 ** (1/12)
-                root_hz_at_octave = 262 * (semitone_factor ** chord_semitone_offset)
-
-                min_distance = float('inf')
-                for freq in frequencies:
-                    if freq <= 0:
-                        continue
-                    # Calculate which semitone this frequency is from C4
-                    semitones_from_c4 = np.log2(freq / 262) * 12
-                    note_class = semitones_from_c4 % 12
-                    target_note_class = chord_semitone_offset % 12
-
-                    distance = min(abs(note_class - target_note_class),
-                                   12 - abs(note_class - target_note_class))
-
-                    if distance < min_distance:
-                        min_distance = distance
-                        root_freq = freq
-
-        except Exception as e:
-            print(f"Warning: could not determine theoretical root for chord {chord_name}: {e}")
-
-        if root_freq is None:
-            # Fallback: use lowest frequency if matching fails
-            root_freq = min(frequencies)
-
-        root_tone = player.generate_rich_tone(root_freq, duration, instrument)
-
-        # Add the root tone with the specified multiplier.
-        # A multiplier of 1.0 (0% slider) means no extra root.
-        # Higher values add proportionally more root before final normalization.
-        extra_root_volume = max(0.0, root_volume_multiplier - 1.0)
-        waveform = waveform + (root_tone * extra_root_volume)
-    
-    # Normalize to prevent clipping
-    max_val = np.max(np.abs(waveform))
-    if max_val > 0:
-        waveform = waveform / max_val * 0.9  # Use 0.9 to leave more headroom
-    
-    # Convert waveform to audio file
-    audio_data = (waveform * 32767).astype(np.int16)
-    
-    # Create bytes buffer
-    buffer = io.BytesIO()
-    wavfile.write(buffer, 44100, audio_data)
-    buffer.seek(0)
-    
-    return send_file(
-        buffer,
-        mimetype='audio/wav',
-        as_attachment=False
-    )
+    f32 = request.args.get('format') == 'f32'
+    key = (tuple(frequencies), instrument, root_volume_multiplier, chord_name, f32)
+    if f32:
+        return audio_response(render_chord, key, 'application/octet-stream',
+                              {'X-Sample-Rate': '44100'})
+    return audio_response(render_chord, key, 'audio/wav')
 
 @app.route('/api/play-tone', methods=['POST'])
 def play_tone():
@@ -398,28 +585,14 @@ def play_tone():
     instrument = data.get('instrument', 'piano').lower()
     duration = data.get('duration', 1.0)
     
-    print(f"Playing tone: {frequency}Hz for {duration}s")
-    
-    player = audio_players.get(instrument, audio_players['piano'])
-    waveform = player.generate_rich_tone(frequency, duration, instrument)
-    
-    # Normalize to prevent clipping
-    max_val = np.max(np.abs(waveform))
-    if max_val > 0:
-        waveform = waveform / max_val * 0.9  # Use 0.9 to leave headroom
-    
-    # Convert waveform to audio file
-    audio_data = (waveform * 32767).astype(np.int16)
+    # Validate input
+    if (isinstance(duration, bool) or not isinstance(duration, (int, float))
+            or not 0 < duration <= MAX_TONE_DURATION):
+        return jsonify({'error': f'Duration must be between 0 and {MAX_TONE_DURATION} seconds'}), 400
     
-    buffer = io.BytesIO()
-    wavfile.write(buffer, 44100, audio_data)
-    buffer.seek(0)
+    print(f"Playing tone: {frequency}Hz for {duration}s")
     
-    return send_file(
-        buffer,
-        mimetype='audio/wav',
-        as_attachment=False
-    )
+    return audio_response(render_tone, (frequency, instrument, duration), 'audio/wav')
 
 @app.route('/api/check-answer', methods=['POST'])
 def check_answer():
@@ -429,94 +602,21 @@ def check_answer():
         progression_names = data.get('progression', [])
         expected_names = data.get('expected', [])
 
-        # Map display names back to enum names
-        display_to_enum = {
-            'I': 'I',
-            'IMAJ7': 'IMAJ7',
-            'Imaj7': 'IMAJ7',
-            'II': 'II',
-            'ii': 'II',
-            'II7': 'IIM7',
-            'ii7': 'IIM7',
-            'III': 'III',
-            'iii': 'III',
-            'III7': 'IIIM7',
-            'iii7': 'IIIM7',
-            'IIIAUG': 'IIIAUG',
-            'III+': 'IIIAUG',
-            'III7': 'III7',
-            'IV': 'IV',
-            'IVMAJ7': 'IVMAJ7',
-            'IVmaj7': 'IVMAJ7',
-            'V': 'V',
-            'V7': 'V7',
-            'VI': 'VI',
-            'vi': 'VI',
-            'VI7': 'VIM7',
-            'vi7': 'VIM7',
-            'VII': 'VII',
-            'vii°': 'VII',
-            'VII7': 'VIIM7B5',
-            'viiø7': 'VIIM7B5',
-        }
-
         # Convert chord display names to enum names
         user_progression = []
         for chord_name in progression_names:
             raw = str(chord_name).strip()
-            
-            # Try direct lookup first
-            if raw in display_to_enum:
-                enum_name = display_to_enum[raw]
-                if enum_name in ChordNumber.__members__:
-                    user_progression.append(ChordNumber[enum_name])
-                else:
-                    print(f"Warning: Enum '{enum_name}' not found for chord '{raw}'")
-                    return jsonify({'error': f'Unknown chord: {raw}'}), 400
-            else:
-                # Try uppercase
-                upper = raw.upper()
-                if upper == 'VII°':
-                    upper = 'VII'
-                if upper == 'VII°SLASH':
-                    upper = 'VIIM7B5'
-                if upper.endswith('°'):
-                    upper = upper[:-1]
-                if upper == 'III+':
-                    upper = 'IIIAUG'
-                
-                if upper in ChordNumber.__members__:
-                    user_progression.append(ChordNumber[upper])
-                else:
-                    print(f"Warning: Unknown chord name '{raw}'")
-                    return jsonify({'error': f'Unknown chord: {raw}'}), 400
+            chord = lookup_chord(raw)
+            if chord is None:
+                print(f"Warning: Unknown chord name '{raw}'")
+                return jsonify({'error': f'Unknown chord: {raw}'}), 400
+            user_progression.append(chord)
         
         # Convert expected progression names to enum for comparison
         expected_progression = []
         for chord_name in expected_names:
-            raw = str(chord_name).strip()
-            
-            # Try display_to_enum mapping first
-            if raw in display_to_enum:
-                enum_name = display_to_enum[raw]
-                if enum_name in ChordNumber.__members__:
-                    expected_progression.append(ChordNumber[enum_name])
-            else:
-                # Try as-is
-                upper = raw.upper()
-                if upper == 'VII°':
-                    upper = 'VII'
-                if upper == 'VII°SLASH':
-                    upper = 'VIIM7B5'
-                if upper.endswith('°'):
-                    upper = upper[:-1]
-                if upper == 'III+':
-                    upper = 'IIIAUG'
-                
-                if upper in ChordNumber.__members__:
-                    expected_progression.append(ChordNumber[upper])
-                else:
-                    expected_progression.append(chord_name)
+            chord = lookup_chord(str(chord_name).strip())
+            expected_progression.append(chord_name if chord is None else chord)
         
         # Check if user's answer matches the expected progression
         is_correct = user_progression == expected_progression
@@ -525,22 +625,8 @@ def check_answer():
         if not expected_names:
             return jsonify({'error': 'No expected progression provided.'}), 400
         
-        # Map chord names for display consistency (same as /api/progression)
-        name_map = {
-            ChordNumber.IMAJ7: "Imaj7",
-            ChordNumber.II: "ii",
-            ChordNumber.IIM7: "ii7",
-            ChordNumber.III: "iii",
-            ChordNumber.IIIM7: "iii7",
-            ChordNumber.IIIAUG: "III+",
-            ChordNumber.IVMAJ7: "IVmaj7",
-            ChordNumber.VI: "vi",
-            ChordNumber.VIM7: "vi7",
-            ChordNumber.VII: "vii°",
-            ChordNumber.VIIM7B5: "viiø7",
-        }
-        actual = [name_map.get(c, c.name) if isinstance(c, ChordNumber) else c for c in expected_progression]
-        user = [name_map.get(c, c.name) for c in user_progression]
+        actual = [CHORD_DISPLAY_NAMES[c] if isinstance(c, ChordNumber) else c for c in expected_progression]
+        user = [CHORD_DISPLAY_NAMES[c] for c in user_progression]
         
         return jsonify({
             'correct': is_correct,
@@ -555,12 +641,11 @@ def check_answer():
 @app.route('/')
 def index():
     """Serve the main HTML page."""
-    return send_file(os.path.join(STATIC_DIR, 'index.html'))
-
-@app.route('/static/<path:filename>')
-def static_files(filename):
-    """Serve static files (CSS, JS, etc)."""
-    return send_from_directory(STATIC_DIR, filename)
+    # Always revalidated, but answered with a 304 while it is unchanged
+    response = Response(versioned_index_html(), mimetype='text/html')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
 
 @app.route('/api/health', methods=['GET'])
 def health():